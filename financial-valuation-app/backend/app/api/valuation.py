@@ -86,12 +86,13 @@ def validate_inputs(analysis_id):
                 elif len(financial_inputs[field]) < 1:
                     validation_errors.append(f'{field} must have at least one value')
         
-        # Check percentage values
+        # Check percentage values. JSON numbers decode to exactly int or float,
+        # so an exact type check is enough and also rejects booleans
         percentage_fields = ['ebit_margin', 'tax_rate', 'terminal_growth_rate']
         for field in percentage_fields:
             if field in financial_inputs:
                 value = financial_inputs[field]
-                if not isinstance(value, (int, float)) or value < 0 or value > 1:
+                if type(value) not in (int, float) or value < 0 or value > 1:
                     validation_errors.append(f'{field} must be a decimal between 0 and 1')
         
         # Check positive values
@@ -99,7 +100,7 @@ def validate_inputs(analysis_id):
         for field in positive_fields:
             if field in financial_inputs:
                 value = financial_inputs[field]
-                if not isinstance(value, (int, float)) or value <= 0:
+                if type(value) not in (int, float) or value <= 0:
                     validation_errors.append(f'{field} must be a positive number')
         
         if validation_errors:
@@ -75,7 +75,8 @@ class FinanceCoreService:
             if field not in financial_inputs:
                 errors.append(f'Missing required field: {field}')
         
-        # Analysis-specific validation
+        # Analysis-specific validation (APV does not require unlevered_cost_of_equity
+        # explicitly; the local calculator can derive it)
         if analysis_type in ['dcf_wacc', 'apv', 'scenario', 'sensitivity', 'monte_carlo']:
             if 'weighted_average_cost_of_capital' not in financial_inputs:
                 errors.append('Missing required field: weighted_average_cost_of_capital')
@@ -84,10 +85,6 @@ class FinanceCoreService:
             if 'cost_of_debt' not in financial_inputs:
                 errors.append('Missing required field: cost_of_debt')
         
-        # For APV, do not require unlevered_cost_of_equity explicitly; local calculator can derive it
-        # if analysis_type == 'apv':
-        #     pass
-        
         elif analysis_type == 'multiples':
             if 'comparable_multiples' not in inputs:
                 errors.append('Missing required field: comparable_multiples')
@@ -9,6 +9,7 @@ Key Functions:
 - calculate_dcf_valuation_wacc: Standard DCF using WACC methodology
 - calculate_adjusted_present_value: APV method separating unlevered value and tax shields
 - calculate_net_debt_for_valuation: Calculate net debt for valuation purposes
+- resolve_free_cash_flow_series: Direct FCF input or driver-based FCF projection
 - validate_terminal_value_assumptions: Professional validation of terminal value inputs
 - calculate_present_value_of_tax_shields: Calculate PV of interest tax shields for APV
 """
@@ -87,7 +88,53 @@ def validate_terminal_value_assumptions(valuation_parameters: ValuationParameter
                 f"appears unrealistically high for sustainable long-term performance"
             )
 
-def calculate_dcf_valuation_wacc(valuation_parameters: ValuationParameters) -> Tuple[float, float, Optional[float], List[float], float, float]:
+def resolve_free_cash_flow_series(valuation_parameters: ValuationParameters) -> np.ndarray:
+    """
+    Return the free cash flow series to value: the direct FCF input if one is given,
+    otherwise the driver-based projection (revenue -> EBIT -> FCF).
+    
+    Args:
+        valuation_parameters: ValuationParameters object with FCF or driver inputs
+        
+    Returns:
+        np.ndarray: Free cash flow series (USD)
+        
+    Raises:
+        ValueError: If neither a direct FCF series nor all driver inputs are available
+    """
+    if len(valuation_parameters.free_cash_flow_series):
+        return np.asarray(valuation_parameters.free_cash_flow_series, dtype=np.float64)
+    
+    # Validate that we have all required inputs for driver-based projection
+    required_inputs = [
+        valuation_parameters.revenue_projections,
+        valuation_parameters.capital_expenditure,
+        valuation_parameters.depreciation_expense,
+        valuation_parameters.net_working_capital_changes
+    ]
+    
+    if not all(len(series) for series in required_inputs):
+        raise ValueError(
+            "No FCF series available for valuation. Please provide either "
+            "free_cash_flow_series or all driver-based inputs."
+        )
+    
+    # Project revenue → EBIT → FCF using professional methodology
+    ebit_series = project_ebit_series(
+        valuation_parameters.revenue_projections, 
+        valuation_parameters.ebit_margin
+    )
+    
+    return project_free_cash_flow(
+        valuation_parameters.revenue_projections,
+        ebit_series,
+        valuation_parameters.capital_expenditure,
+        valuation_parameters.depreciation_expense,
+        valuation_parameters.net_working_capital_changes,
+        valuation_parameters.corporate_tax_rate
+    )
+
+def calculate_dcf_valuation_wacc(valuation_parameters: ValuationParameters) -> Tuple[float, float, Optional[float], np.ndarray, float, float]:
     """
     Calculate DCF valuation using the WACC (Weighted Average Cost of Capital) method.
     
@@ -106,7 +153,7 @@ def calculate_dcf_valuation_wacc(valuation_parameters: ValuationParameters) -> T
         - float: Enterprise value (USD)
         - float: Equity value (USD)
         - Optional[float]: Price per share (USD)
-        - List[float]: Free cash flow series (USD)
+        - np.ndarray: Free cash flow series (USD)
         - float: Terminal value (USD)
         - float: Present value of terminal value (USD)
         
@@ -118,39 +165,9 @@ def calculate_dcf_valuation_wacc(valuation_parameters: ValuationParameters) -> T
     validate_terminal_value_assumptions(valuation_parameters)
     
     # Step 1: Determine free cash flow series
-    if valuation_parameters.free_cash_flow_series:
-        free_cash_flow_series = valuation_parameters.free_cash_flow_series
-    else:
-        # Validate that we have all required inputs for driver-based projection
-        required_inputs = [
-            valuation_parameters.revenue_projections,
-            valuation_parameters.capital_expenditure,
-            valuation_parameters.depreciation_expense,
-            valuation_parameters.net_working_capital_changes
-        ]
-        
-        if not all(required_inputs):
-            raise ValueError(
-                "No FCF series available for valuation. Please provide either "
-                "free_cash_flow_series or all driver-based inputs."
-            )
-        
-        # Project revenue → EBIT → FCF using professional methodology
-        ebit_series = project_ebit_series(
-            valuation_parameters.revenue_projections, 
-            valuation_parameters.ebit_margin
-        )
-        
-        free_cash_flow_series = project_free_cash_flow(
-            valuation_parameters.revenue_projections,
-            ebit_series,
-            valuation_parameters.capital_expenditure,
-            valuation_parameters.depreciation_expense,
-            valuation_parameters.net_working_capital_changes,
-            valuation_parameters.corporate_tax_rate
-        )
+    free_cash_flow_series = resolve_free_cash_flow_series(valuation_parameters)
     
-    if not free_cash_flow_series:
+    if len(free_cash_flow_series) == 0:
         raise ValueError("No free cash flow series available for valuation")
     
     # Step 2: Calculate WACC using target capital structure or iterative approach
@@ -163,24 +180,16 @@ def calculate_dcf_valuation_wacc(valuation_parameters: ValuationParameters) -> T
     # Step 3: Discount each FCF to present value
     if valuation_parameters.use_mid_year_convention:
         # Mid-year convention: cash flows occur at middle of year
-        discount_factors = [
-            (1 + weighted_average_cost_of_capital) ** (period + 0.5) 
-            for period in range(len(free_cash_flow_series))
-        ]
+        discount_periods = np.arange(len(free_cash_flow_series)) + 0.5
     else:
         # Year-end convention: cash flows occur at end of year
-        discount_factors = [
-            (1 + weighted_average_cost_of_capital) ** (period + 1) 
-            for period in range(len(free_cash_flow_series))
-        ]
-    
-    present_value_of_fcfs = [
-        fcf / discount_factor 
-        for fcf, discount_factor in zip(free_cash_flow_series, discount_factors)
-    ]
+        discount_periods = np.arange(len(free_cash_flow_series)) + 1.0
+    discount_factors = (1 + weighted_average_cost_of_capital) ** discount_periods
+    
+    present_value_of_fcfs = free_cash_flow_series / discount_factors
 
     # Step 4: Calculate terminal value using Gordon Growth Model
-    terminal_fcf = free_cash_flow_series[-1]
+    terminal_fcf = float(free_cash_flow_series[-1])
     terminal_value = (
         terminal_fcf * (1 + valuation_parameters.terminal_growth_rate) / 
         (weighted_average_cost_of_capital - valuation_parameters.terminal_growth_rate)
@@ -199,7 +208,7 @@ def calculate_dcf_valuation_wacc(valuation_parameters: ValuationParameters) -> T
         )
 
     # Step 5: Calculate enterprise value
-    enterprise_value = sum(present_value_of_fcfs) + present_value_of_terminal
+    enterprise_value = float(present_value_of_fcfs.sum()) + present_value_of_terminal
 
     # Step 6: Calculate equity value and price per share
     net_debt = calculate_net_debt_for_valuation(valuation_parameters)
@@ -246,21 +255,24 @@ def calculate_present_value_of_tax_shields(
     Returns:
         float: Present value of tax shields (USD)
     """
-    present_value_of_tax_shields = 0.0
-    
-    if debt_schedule:
-        for year, debt_level in debt_schedule.items():
-            if debt_level > 0:
-                interest_expense = debt_level * cost_of_debt
-                tax_shield = interest_expense * corporate_tax_rate
-                
-                # Discount at unlevered cost of equity (not cost of debt)
-                if use_mid_year_convention:
-                    discount_factor = (1 + unlevered_cost_of_equity) ** (year + 0.5)
-                else:
-                    discount_factor = (1 + unlevered_cost_of_equity) ** (year + 1)
-                
-                present_value_of_tax_shields += tax_shield / discount_factor
+    if not debt_schedule:
+        return 0.0
+    
+    years = np.fromiter(debt_schedule.keys(), dtype=np.float64, count=len(debt_schedule))
+    debt_levels = np.fromiter(debt_schedule.values(), dtype=np.float64, count=len(debt_schedule))
+    
+    # Only years with outstanding debt generate an interest tax shield
+    has_debt = debt_levels > 0
+    if not has_debt.any():
+        return 0.0
+    
+    tax_shields = debt_levels[has_debt] * cost_of_debt * corporate_tax_rate
+    
+    # Discount at unlevered cost of equity (not cost of debt)
+    periods = years[has_debt] + (0.5 if use_mid_year_convention else 1.0)
+    discount_factors = (1 + unlevered_cost_of_equity) ** periods
+    
+    present_value_of_tax_shields = float(np.sum(tax_shields / discount_factors))
     
     return present_value_of_tax_shields
 
@@ -291,61 +303,23 @@ def calculate_adjusted_present_value(valuation_parameters: ValuationParameters)
     # Step 1: Calculate unlevered cost of equity using proper Hamada equation
     unlevered_cost_of_equity = valuation_parameters.calculate_unlevered_cost_of_equity()
     
-    # Step 2: Calculate unlevered FCF (same as WACC method)
-    if valuation_parameters.free_cash_flow_series:
-        unlevered_fcf_series = valuation_parameters.free_cash_flow_series
-    else:
-        # Validate that we have all required inputs for driver-based projection
-        required_inputs = [
-            valuation_parameters.revenue_projections,
-            valuation_parameters.capital_expenditure,
-            valuation_parameters.depreciation_expense,
-            valuation_parameters.net_working_capital_changes
-        ]
-        
-        if not all(required_inputs):
-            raise ValueError(
-                "No FCF series available for APV valuation. Please provide either "
-                "free_cash_flow_series or all driver-based inputs."
-            )
-        
-        # Project revenue → EBIT → FCF
-        ebit_series = project_ebit_series(
-            valuation_parameters.revenue_projections, 
-            valuation_parameters.ebit_margin
-        )
-        
-        unlevered_fcf_series = project_free_cash_flow(
-            valuation_parameters.revenue_projections,
-            ebit_series,
-            valuation_parameters.capital_expenditure,
-            valuation_parameters.depreciation_expense,
-            valuation_parameters.net_working_capital_changes,
-            valuation_parameters.corporate_tax_rate
-        )
+    # Step 2: Calculate unlevered FCF (same series as the WACC method)
+    unlevered_fcf_series = resolve_free_cash_flow_series(valuation_parameters)
     
-    if not unlevered_fcf_series:
+    if len(unlevered_fcf_series) == 0:
         raise ValueError("No FCF series available for APV valuation")
     
     # Step 3: Discount unlevered FCFs using unlevered cost of equity
     if valuation_parameters.use_mid_year_convention:
-        discount_factors = [
-            (1 + unlevered_cost_of_equity) ** (period + 0.5) 
-            for period in range(len(unlevered_fcf_series))
-        ]
+        discount_periods = np.arange(len(unlevered_fcf_series)) + 0.5
     else:
-        discount_factors = [
-            (1 + unlevered_cost_of_equity) ** (period + 1) 
-            for period in range(len(unlevered_fcf_series))
-        ]
-    
-    present_value_of_unlevered_fcfs = [
-        fcf / discount_factor 
-        for fcf, discount_factor in zip(unlevered_fcf_series, discount_factors)
-    ]
+        discount_periods = np.arange(len(unlevered_fcf_series)) + 1.0
+    discount_factors = (1 + unlevered_cost_of_equity) ** discount_periods
+    
+    present_value_of_unlevered_fcfs = unlevered_fcf_series / discount_factors
     
     # Step 4: Calculate terminal value using unlevered cost of equity
-    terminal_unlevered_fcf = unlevered_fcf_series[-1]
+    terminal_unlevered_fcf = float(unlevered_fcf_series[-1])
     terminal_value = (
         terminal_unlevered_fcf * (1 + valuation_parameters.terminal_growth_rate) / 
         (unlevered_cost_of_equity - valuation_parameters.terminal_growth_rate)
@@ -362,7 +336,7 @@ def calculate_adjusted_present_value(valuation_parameters: ValuationParameters)
         )
     
     # Step 5: Calculate unlevered enterprise value
-    unlevered_enterprise_value = sum(present_value_of_unlevered_fcfs) + present_value_of_terminal
+    unlevered_enterprise_value = float(present_value_of_unlevered_fcfs.sum()) + present_value_of_terminal
     
     # Step 6: Calculate present value of interest tax shields
     present_value_of_tax_shields = calculate_present_value_of_tax_shields(
@@ -11,7 +11,11 @@ import sys
 import traceback
 from typing import Dict, Any, List, Optional
 from dataclasses import fields
-import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
 
 # Import the finance calculator components
 from finance_calculator import FinancialValuationEngine, parse_financial_inputs, FinancialInputs
@@ -24,14 +28,38 @@ from scenario import run_scenarios
 from sensitivity import perform_sensitivity_analysis
 from monte_carlo import run_monte_carlo
 
+# Sentinel for keys absent from the input, as opposed to keys explicitly set to None
+_ABSENT = object()
+
+# Expected type for each financial input field (old and new field names), with
+# the display name used in error messages resolved once at import
+_FIELD_TYPE_SCHEMA = tuple(
+    (field, expected_type, expected_type.__name__ if hasattr(expected_type, '__name__') else str(expected_type))
+    for field, expected_type in (
+        ("revenue", list),
+        ("ebit_margin", (int, float)),
+        ("tax_rate", (int, float)),
+        ("terminal_growth", (int, float)),
+        ("wacc", (int, float)),
+        ("share_count", (int, float)),
+        ("cost_of_debt", (int, float)),
+        ("terminal_growth_rate", (int, float)),
+        ("weighted_average_cost_of_capital", (int, float))
+    )
+)
+
 class ValuationDebugger:
     """Debugger for the finance calculator with step-by-step validation."""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.engine = FinancialValuationEngine()
+        self.verbose = verbose
         self.debug_info = []
         self.errors = []
         self.warnings = []
+        # Exceptions keyed by their index in self.errors; tracebacks are only
+        # formatted when a report is generated (or immediately when verbose)
+        self._error_exceptions: Dict[int, Exception] = {}
         
     def log_info(self, message: str):
         """Log informational message."""
@@ -43,9 +71,16 @@ class ValuationDebugger:
         error_msg = f"❌ {message}"
         if exception:
             error_msg += f"\n   Exception: {type(exception).__name__}: {str(exception)}"
-            error_msg += f"\n   Traceback: {traceback.format_exc()}"
+            self._error_exceptions[len(self.errors)] = exception
         self.errors.append(error_msg)
         print(error_msg)
+        if exception and self.verbose:
+            print(f"   Traceback: {self._format_traceback(exception)}")
+        
+    @staticmethod
+    def _format_traceback(exception: Exception) -> str:
+        """Format the traceback recorded on an exception."""
+        return "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
         
     def log_warning(self, message: str):
         """Log warning message."""
@@ -85,17 +120,18 @@ class ValuationDebugger:
             "wacc": "weighted_average_cost_of_capital"
         }
         
+        # Look every candidate key up once; _ABSENT distinguishes a missing key from an explicit None
+        present = {
+            key: financial_data.get(key, _ABSENT)
+            for key in (*required_fields, *new_field_mappings.values())
+        }
+        
         missing_fields = []
         for field in required_fields:
-            # Check if field exists or if new field name exists
-            field_exists = field in financial_data
-            new_field_exists = field in new_field_mappings and new_field_mappings[field] in financial_data
+            value = present[field]
+            new_value = present.get(new_field_mappings.get(field), _ABSENT)
             
-            if not field_exists and not new_field_exists:
-                missing_fields.append(field)
-            elif field_exists and financial_data[field] is None:
-                missing_fields.append(field)
-            elif new_field_exists and financial_data[new_field_mappings[field]] is None:
+            if (value is _ABSENT and new_value is _ABSENT) or value is None or new_value is None:
                 missing_fields.append(field)
                 
         if missing_fields:
@@ -104,11 +140,11 @@ class ValuationDebugger:
             self.log_success("All required financial fields present")
             
         # Log which field names are being used
-        for field in ["terminal_growth", "wacc"]:
-            if field in financial_data:
+        for field, new_field in new_field_mappings.items():
+            if present[field] is not _ABSENT:
                 self.log_info(f"Using old field name: {field}")
-            elif field in new_field_mappings and new_field_mappings[field] in financial_data:
-                self.log_info(f"Using new field name: {new_field_mappings[field]} (instead of {field})")
+            elif present[new_field] is not _ABSENT:
+                self.log_info(f"Using new field name: {new_field} (instead of {field})")
             
         # Check for empty lists
         list_fields = ["revenue", "capex", "depreciation", "nwc_changes"]
@@ -123,38 +159,12 @@ class ValuationDebugger:
         """Validate data types of financial inputs."""
         self.log_info("Step 3: Validating data types...")
         
-        type_checks = [
-            ("revenue", list),
-            ("ebit_margin", (int, float)),
-            ("tax_rate", (int, float)),
-            ("terminal_growth", (int, float)),
-            ("wacc", (int, float)),
-            ("share_count", (int, float)),
-            ("cost_of_debt", (int, float))
-        ]
-        
-        # Add checks for new field names
-        new_type_checks = [
-            ("terminal_growth_rate", (int, float)),
-            ("weighted_average_cost_of_capital", (int, float))
+        type_errors = [
+            f"{field}: expected {expected_name}, got {type(financial_data[field]).__name__}"
+            for field, expected_type, expected_name in _FIELD_TYPE_SCHEMA
+            if field in financial_data and not isinstance(financial_data[field], expected_type)
         ]
         
-        type_errors = []
-        for field, expected_type in type_checks:
-            if field in financial_data:
-                if not isinstance(financial_data[field], expected_type):
-                    expected_name = expected_type.__name__ if hasattr(expected_type, '__name__') else str(expected_type)
-                    actual_name = type(financial_data[field]).__name__
-                    type_errors.append(f"{field}: expected {expected_name}, got {actual_name}")
-                    
-        # Check new field names
-        for field, expected_type in new_type_checks:
-            if field in financial_data:
-                if not isinstance(financial_data[field], expected_type):
-                    expected_name = expected_type.__name__ if hasattr(expected_type, '__name__') else str(expected_type)
-                    actual_name = type(financial_data[field]).__name__
-                    type_errors.append(f"{field}: expected {expected_name}, got {actual_name}")
-                    
         if type_errors:
             self.log_error(f"Data type errors: {type_errors}")
             return False
@@ -201,19 +211,25 @@ class ValuationDebugger:
         self.log_info("Step 5: Validating list lengths...")
         
         list_fields = ["revenue", "capex", "depreciation", "nwc_changes"]
-        list_lengths = {}
+        lists = [
+            financial_data[field] for field in list_fields
+            if field in financial_data and isinstance(financial_data[field], list)
+        ]
         
-        for field in list_fields:
-            if field in financial_data and isinstance(financial_data[field], list):
-                list_lengths[field] = len(financial_data[field])
-                
-        if len(set(list_lengths.values())) > 1:
+        if not lists:
+            return True
+            
+        expected_length = len(lists[0])
+        if any(len(values) != expected_length for values in lists):
+            # Only build the per-field report once a mismatch is found
+            list_lengths = {
+                field: len(financial_data[field]) for field in list_fields
+                if field in financial_data and isinstance(financial_data[field], list)
+            }
             self.log_error(f"Inconsistent list lengths: {list_lengths}")
             return False
             
-        if list_lengths:
-            self.log_success(f"All lists have consistent length: {list(list_lengths.values())[0]}")
-            
+        self.log_success(f"All lists have consistent length: {expected_length}")
         return True
         
     def test_financial_inputs_creation(self, data: Dict[str, Any]) -> Optional[FinancialInputs]:
@@ -376,7 +392,11 @@ class ValuationDebugger:
                 "total_warnings": len(self.warnings),
                 "total_info": len(self.debug_info)
             },
-            "errors": self.errors,
+            "errors": [
+                f"{error}\n   Traceback: {self._format_traceback(self._error_exceptions[index])}"
+                if index in self._error_exceptions else error
+                for index, error in enumerate(self.errors)
+            ],
             "warnings": self.warnings,
             "debug_info": self.debug_info
         }
@@ -389,8 +409,10 @@ class ValuationDebugger:
         
         # Step 1: Load and validate JSON
         try:
-            with open(input_file, 'r') as f:
-                data = json.load(f)
+            with open(input_file, 'rb') as f:
+                raw_data = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below covers both
+            data = orjson.loads(raw_data) if orjson else json.loads(raw_data)
             self.log_success(f"Successfully loaded input file: {input_file}")
         except FileNotFoundError:
             self.log_error(f"Input file not found: {input_file}")
@@ -459,18 +481,27 @@ class ValuationDebugger:
 
 def main():
     """Main function to run the debugger."""
-    if len(sys.argv) != 2:
-        print("Usage: python debug_valuation.py <input_file.json>")
+    # --verbose prints each exception's traceback as it is logged, rather than
+    # only recording it in the saved report
+    args = sys.argv[1:]
+    verbose = "--verbose" in args
+    args = [arg for arg in args if arg != "--verbose"]
+    if len(args) != 1:
+        print("Usage: python debug_valuation.py [--verbose] <input_file.json>")
         sys.exit(1)
         
-    input_file = sys.argv[1]
-    debugger = ValuationDebugger()
+    input_file = args[0]
+    debugger = ValuationDebugger(verbose=verbose)
     report = debugger.debug_valuation(input_file)
     
     # Save debug report to file
     debug_report_file = input_file.replace('.json', '_debug_report.json')
-    with open(debug_report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson:
+        report_bytes = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    else:
+        report_bytes = json.dumps(report, indent=2).encode('utf-8')
+    with open(debug_report_file, 'wb') as f:
+        f.write(report_bytes)
     print(f"\n📄 Debug report saved to: {debug_report_file}")
 
 if __name__ == "__main__":
@@ -17,7 +17,7 @@ import numpy as np
 def project_revenue_series(
     base_revenue_values: List[float], 
     annual_growth_rates: List[float]
-) -> List[float]:
+) -> np.ndarray:
     """
     Project revenue series using year-over-year growth rates.
     
@@ -37,41 +37,37 @@ def project_revenue_series(
         annual_growth_rates: List of annual growth rates (as decimals, e.g., 0.10 for 10%)
         
     Returns:
-        List[float]: Projected revenue values (USD)
+        np.ndarray: Projected revenue values (USD)
         
     Raises:
         ValueError: If growth_rates length is neither equal nor one less than base_revenue
         ValueError: If any growth rate is less than -1 (which would make revenue negative)
         ValueError: If base_revenue is empty or growth_rates is empty
     """
-    if not base_revenue_values:
+    if len(base_revenue_values) == 0:
         raise ValueError("base_revenue_values cannot be empty")
     
-    if not annual_growth_rates:
+    if len(annual_growth_rates) == 0:
         raise ValueError("annual_growth_rates cannot be empty")
     
-    # Validate growth rates for reasonableness
-    for index, growth_rate in enumerate(annual_growth_rates):
-        if growth_rate < -1:
-            raise ValueError(
-                f"Growth rate at index {index} ({growth_rate:.1%}) cannot be less than -100%"
-            )
+    growth_rates = np.asarray(annual_growth_rates, dtype=np.float64)
     
-    if len(annual_growth_rates) == len(base_revenue_values):
+    # Validate growth rates for reasonableness in one vectorized comparison,
+    # reporting the first offending index
+    invalid_indices = np.flatnonzero(growth_rates < -1)
+    if invalid_indices.size:
+        index = invalid_indices[0]
+        raise ValueError(
+            f"Growth rate at index {index} ({growth_rates[index]:.1%}) cannot be less than -100%"
+        )
+    
+    if len(growth_rates) == len(base_revenue_values):
         # Mode 1: Apply growth rate directly to each base revenue value
-        projected_revenue = [
-            base_revenue * (1 + growth_rate) 
-            for base_revenue, growth_rate in zip(base_revenue_values, annual_growth_rates)
-        ]
-        return projected_revenue
+        return np.asarray(base_revenue_values, dtype=np.float64) * (1 + growth_rates)
         
-    elif len(annual_growth_rates) == len(base_revenue_values) - 1:
+    elif len(growth_rates) == len(base_revenue_values) - 1:
         # Mode 2: Apply compound growth from first base revenue value
-        projected_revenue = [base_revenue_values[0]]
-        for growth_rate in annual_growth_rates:
-            next_revenue = projected_revenue[-1] * (1 + growth_rate)
-            projected_revenue.append(next_revenue)
-        return projected_revenue
+        return _project_revenue_cumprod(base_revenue_values[0], growth_rates)
         
     else:
         raise ValueError(
@@ -80,10 +76,33 @@ def project_revenue_series(
             f"({len(base_revenue_values) - 1})"
         )
 
+def _project_revenue_cumprod(
+    starting_revenue: float,
+    annual_growth_rates: np.ndarray
+) -> np.ndarray:
+    """
+    Compound a starting revenue value through a series of growth rates.
+    
+    Equivalent to the recurrence revenue[i] = revenue[i-1] * (1 + growth[i-1]),
+    evaluated as a single cumulative product. The starting value leads the
+    product so the multiplications happen in the same order as the recurrence.
+    
+    Args:
+        starting_revenue: Revenue of the first projection year (USD)
+        annual_growth_rates: Growth rates applied to each following year
+        
+    Returns:
+        np.ndarray: Compounded revenue series, starting with starting_revenue
+    """
+    growth_factors = np.empty(len(annual_growth_rates) + 1, dtype=np.float64)
+    growth_factors[0] = starting_revenue
+    np.add(1, annual_growth_rates, out=growth_factors[1:])
+    return np.cumprod(growth_factors)
+
 def project_ebit_series(
     revenue_series: List[float], 
     ebit_margin: float
-) -> List[float]:
+) -> np.ndarray:
     """
     Compute EBIT series from revenue projections and margin.
     
@@ -91,17 +110,17 @@ def project_ebit_series(
     EBIT = Revenue × EBIT Margin
     
     Args:
-        revenue_series: List of projected revenue values (USD)
+        revenue_series: List or array of projected revenue values (USD)
         ebit_margin: EBIT margin as a decimal (e.g., 0.20 for 20%)
         
     Returns:
-        List[float]: Projected EBIT values (USD)
+        np.ndarray: Projected EBIT values (USD)
         
     Raises:
         ValueError: If margin is negative or greater than 1
         ValueError: If revenue_series is empty
     """
-    if not revenue_series:
+    if len(revenue_series) == 0:
         raise ValueError("revenue_series cannot be empty")
     
     if ebit_margin < 0 or ebit_margin > 1:
@@ -109,8 +128,7 @@ def project_ebit_series(
             f"EBIT margin ({ebit_margin:.1%}) must be between 0% and 100%"
         )
     
-    ebit_series = [revenue * ebit_margin for revenue in revenue_series]
-    return ebit_series
+    return np.multiply(np.asarray(revenue_series, dtype=np.float64), float(ebit_margin))
 
 def project_free_cash_flow(
     revenue_series: List[float],
@@ -119,7 +137,7 @@ def project_free_cash_flow(
     depreciation_expense: List[float],
     net_working_capital_changes: List[float],
     corporate_tax_rate: float
-) -> List[float]:
+) -> np.ndarray:
     """
     Compute comprehensive Free Cash Flow series using professional methodology.
     
@@ -131,24 +149,24 @@ def project_free_cash_flow(
     including all relevant cash flow components for accurate valuation.
     
     Args:
-        revenue_series: List of revenue values (for validation purposes)
-        ebit_series: List of EBIT values (USD)
-        capital_expenditure: List of capital expenditure values (USD)
-        depreciation_expense: List of depreciation values (USD)
-        net_working_capital_changes: List of NWC changes (USD)
+        revenue_series: List or array of revenue values (for validation purposes)
+        ebit_series: List or array of EBIT values (USD)
+        capital_expenditure: List or array of capital expenditure values (USD)
+        depreciation_expense: List or array of depreciation values (USD)
+        net_working_capital_changes: List or array of NWC changes (USD)
         corporate_tax_rate: Corporate tax rate as decimal (e.g., 0.21 for 21%)
         
     Returns:
-        List[float]: Projected Free Cash Flow values (USD)
+        np.ndarray: Projected Free Cash Flow values (USD)
         
     Raises:
         ValueError: If any input list has different lengths
         ValueError: If corporate_tax_rate is negative or greater than 1
         ValueError: If any required input list is empty
     """
-    # Validate required inputs
+    # Validate required inputs (by length, so NumPy arrays are accepted as well as lists)
     required_inputs = [ebit_series, capital_expenditure, depreciation_expense, net_working_capital_changes]
-    if not all(required_inputs):
+    if not all(len(series) for series in required_inputs):
         raise ValueError("All required input lists must be non-empty")
     
     if corporate_tax_rate < 0 or corporate_tax_rate > 1:
@@ -156,35 +174,24 @@ def project_free_cash_flow(
             f"Corporate tax rate ({corporate_tax_rate:.1%}) must be between 0% and 100%"
         )
     
-
-    
-    # Validate that all input lists have consistent lengths
-    input_lengths = [
-        len(ebit_series), 
-        len(capital_expenditure), 
-        len(depreciation_expense), 
-        len(net_working_capital_changes)
-    ]
-    
-    if len(set(input_lengths)) > 1:
+    # Validate that all input lists have consistent lengths, stopping at the first mismatch
+    projection_length = len(ebit_series)
+    if any(len(series) != projection_length
+           for series in (capital_expenditure, depreciation_expense, net_working_capital_changes)):
         raise ValueError(
             f"All input lists must have the same length. "
             f"Lengths: EBIT={len(ebit_series)}, CapEx={len(capital_expenditure)}, "
             f"Depreciation={len(depreciation_expense)}, NWC Changes={len(net_working_capital_changes)}"
         )
     
-    # Calculate FCF for each period
-    free_cash_flow_series = []
-    for (ebit, capex, depreciation, nwc_change) in zip(ebit_series, capital_expenditure, 
-                                                       depreciation_expense, net_working_capital_changes):
-        
-        # Calculate NOPAT (Net Operating Profit After Tax)
-        net_operating_profit_after_tax = ebit * (1 - corporate_tax_rate)
-        
-        # Calculate comprehensive FCF
-        free_cash_flow = (net_operating_profit_after_tax + depreciation - capex - nwc_change)
-        
-        free_cash_flow_series.append(free_cash_flow)
+    # Calculate NOPAT (Net Operating Profit After Tax) for all periods at once
+    net_operating_profit_after_tax = np.asarray(ebit_series, dtype=np.float64) * (1 - corporate_tax_rate)
+    
+    # Calculate comprehensive FCF, accumulating in place into the NOPAT buffer
+    free_cash_flow_series = net_operating_profit_after_tax
+    free_cash_flow_series += np.asarray(depreciation_expense, dtype=np.float64)
+    free_cash_flow_series -= np.asarray(capital_expenditure, dtype=np.float64)
+    free_cash_flow_series -= np.asarray(net_working_capital_changes, dtype=np.float64)
     
     return free_cash_flow_series
 
@@ -82,6 +82,13 @@ ERROR_MESSAGES = {
         "suggestion": "Ensure '{field_name}' is of type {expected_type}"
     },
     
+    "INVALID_SERIES_VALUE": {
+        "message": "Field '{field_name}' has a non-numeric or non-finite value at index {index}: {value}",
+        "category": ErrorCategory.VALIDATION,
+        "severity": ErrorSeverity.ERROR,
+        "suggestion": "Ensure every entry of '{field_name}' is a finite number"
+    },
+    
     "NEGATIVE_VALUE": {
         "message": "Field '{field_name}' cannot be negative. Value: {value}",
         "category": ErrorCategory.VALIDATION,
@@ -255,10 +262,14 @@ def validate_list_consistency(lists: Dict[str, list]) -> None:
     Raises:
         FinanceCoreError: If lists have inconsistent lengths
     """
-    non_empty_lists = {name: lst for name, lst in lists.items() if lst}
+    expected_length = None
     
-    if len(non_empty_lists) > 1:
-        lengths = {name: len(lst) for name, lst in non_empty_lists.items()}
-        if len(set(lengths.values())) > 1:
-            length_str = ", ".join([f"{name}={length}" for name, length in lengths.items()])
+    for lst in lists.values():
+        if len(lst) == 0:
+            continue
+        if expected_length is None:
+            expected_length = len(lst)
+        elif len(lst) != expected_length:
+            # Only build the full length report once a mismatch is found
+            length_str = ", ".join([f"{name}={len(lst)}" for name, lst in lists.items() if len(lst)])
             raise create_error("INCONSISTENT_LIST_LENGTHS", lengths=length_str) 
\ No newline at end of file
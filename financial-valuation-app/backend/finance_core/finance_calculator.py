@@ -20,15 +20,50 @@ from .monte_carlo import simulate_monte_carlo
 from .sensitivity import perform_sensitivity_analysis
 from .error_messages import create_error, validate_required_field, validate_non_negative, validate_list_consistency, FinanceCoreError
 
+def _to_float_series(field_name: str, values: Any) -> np.ndarray:
+    """
+    Convert a per-year input series to a float64 array.
+    
+    None is treated as an empty series, so required-field validation reports it
+    as missing. Every entry must be a finite real number; None, NaN, infinities
+    and strings are rejected rather than coerced.
+    
+    Args:
+        field_name: Input field name used in error messages
+        values: Sequence (or array) of per-year values, or None
+        
+    Returns:
+        np.ndarray: One-dimensional float64 array
+        
+    Raises:
+        FinanceCoreError: If the series is not a sequence or has an invalid entry
+    """
+    if values is None:
+        return np.empty(0, dtype=np.float64)
+    
+    if not isinstance(values, (list, tuple, np.ndarray)):
+        raise create_error(
+            "INVALID_DATA_TYPE",
+            field_name=field_name,
+            expected_type="list",
+            actual_type=type(values).__name__
+        )
+    
+    for index, value in enumerate(values):
+        if isinstance(value, bool) or not isinstance(value, (int, float, np.integer, np.floating)) or not np.isfinite(value):
+            raise create_error("INVALID_SERIES_VALUE", field_name=field_name, index=index, value=repr(value))
+    
+    return np.asarray(values, dtype=np.float64)
+
 @dataclass
 class FinancialInputs:
     """Comprehensive input data structure for financial valuation calculations."""
-    # Basic financial data (required)
-    revenue: List[float]
+    # Basic financial data (required); the per-year series are held as float64 arrays
+    revenue: np.ndarray
     ebit_margin: float
-    capex: List[float]
-    depreciation: List[float]
-    nwc_changes: List[float]
+    capex: np.ndarray
+    depreciation: np.ndarray
+    nwc_changes: np.ndarray
     tax_rate: float
     terminal_growth: float
     wacc: float
@@ -66,6 +101,13 @@ class FinancialInputs:
     # Configuration toggles (optional)
     use_input_wacc: bool = True
     use_debt_schedule: bool = False
+    
+    def __post_init__(self):
+        """Convert the per-year series to float64 arrays once, at construction."""
+        self.revenue = _to_float_series("revenue", self.revenue)
+        self.capex = _to_float_series("capex", self.capex)
+        self.depreciation = _to_float_series("depreciation", self.depreciation)
+        self.nwc_changes = _to_float_series("nwc_changes", self.nwc_changes)
 
 class FinancialValuationEngine:
     """
@@ -217,7 +259,7 @@ class FinancialValuationEngine:
         }
         
         for field_name, field_value in required_fields.items():
-            if not field_value:
+            if len(field_value) == 0:
                 raise create_error("MISSING_REQUIRED_FIELD", field_name=field_name)
         
         # Validate numeric fields are non-negative
@@ -251,7 +293,8 @@ class FinancialValuationEngine:
         
         validate_list_consistency(list_fields)
     
-    def calculate_dcf_valuation(self, inputs: FinancialInputs) -> Dict[str, Any]:
+    def calculate_dcf_valuation(self, inputs: FinancialInputs,
+                                params: Optional[ValuationParameters] = None) -> Dict[str, Any]:
         """
         Perform DCF (Discounted Cash Flow) valuation using WACC methodology.
         
@@ -271,6 +314,7 @@ class FinancialValuationEngine:
         
         Args:
             inputs: FinancialInputs object containing all required valuation inputs
+            params: ValuationParameters already converted from inputs (converted here if omitted)
             
         Returns:
             Dict containing:
@@ -289,7 +333,8 @@ class FinancialValuationEngine:
         """
         try:
             # Convert inputs to internal parameter structure
-            params = self._convert_to_valuation_params(inputs)
+            if params is None:
+                params = self._convert_to_valuation_params(inputs)
             
             # Perform DCF calculation using WACC method
             ev, equity, price_per_share, fcf_series, terminal_value, pv_terminal = calculate_dcf_valuation_wacc(params)
@@ -315,7 +360,7 @@ class FinancialValuationEngine:
                 "enterprise_value": round(ev, 1),
                 "equity_value": round(equity, 1),
                 "price_per_share": round(price_per_share, 2) if price_per_share else 0.0,
-                "free_cash_flows_after_tax_fcff": [round(fcf, 1) for fcf in fcf_series],
+                "free_cash_flows_after_tax_fcff": [round(fcf, 1) for fcf in fcf_series.tolist()],
                 "terminal_value": round(terminal_value, 1),
                 "present_value_of_terminal": round(pv_terminal, 1),
                 "present_value_of_fcfs": round(pv_fcfs, 1),
@@ -338,7 +383,8 @@ class FinancialValuationEngine:
             else:
                 raise create_error("DCF_CALCULATION_FAILED", reason=str(e))
     
-    def calculate_apv_valuation(self, inputs: FinancialInputs) -> Dict[str, Any]:
+    def calculate_apv_valuation(self, inputs: FinancialInputs,
+                                params: Optional[ValuationParameters] = None) -> Dict[str, Any]:
         """
         Perform APV (Adjusted Present Value) valuation analysis.
         
@@ -357,6 +403,7 @@ class FinancialValuationEngine:
         
         Args:
             inputs: FinancialInputs object containing all required valuation inputs
+            params: ValuationParameters already converted from inputs (converted here if omitted)
             
         Returns:
             Dict containing:
@@ -374,7 +421,8 @@ class FinancialValuationEngine:
             FinanceCoreError: If calculation fails due to invalid inputs or parameters
         """
         try:
-            params = self._convert_to_valuation_params(inputs)
+            if params is None:
+                params = self._convert_to_valuation_params(inputs)
             ev, equity, price_per_share, apv_components = calculate_adjusted_present_value(params)
             
             # Get net debt breakdown
@@ -393,7 +441,7 @@ class FinancialValuationEngine:
                     "value_unlevered": round(apv_components.get("value_unlevered", 0), 1),
                     "pv_tax_shield": round(apv_components.get("pv_tax_shield", 0), 1)
                 },
-                "unlevered_fcfs_used": apv_components.get("unlevered_fcfs", []),
+                "unlevered_fcfs_used": np.asarray(apv_components.get("unlevered_fcfs", [])).tolist(),
                 "equity_value": round(equity, 1),
                 "price_per_share": round(price_per_share, 2) if price_per_share else 0.0,
                 "net_debt_breakdown": {
@@ -409,7 +457,8 @@ class FinancialValuationEngine:
             else:
                 raise create_error("DCF_CALCULATION_FAILED", reason=f"APV calculation failed: {str(e)}")
     
-    def analyze_comparable_multiples(self, inputs: FinancialInputs) -> Dict[str, Any]:
+    def analyze_comparable_multiples(self, inputs: FinancialInputs,
+                                     params: Optional[ValuationParameters] = None) -> Dict[str, Any]:
         """
         Perform comparable multiples analysis for relative valuation.
         
@@ -427,6 +476,7 @@ class FinancialValuationEngine:
         
         Args:
             inputs: FinancialInputs object containing financial data and comparable multiples
+            params: ValuationParameters already converted from inputs (converted here if omitted)
             
         Returns:
             Dict containing:
@@ -443,7 +493,8 @@ class FinancialValuationEngine:
             if not inputs.comparable_multiples:
                 raise create_error("EMPTY_COMPARABLE_DATA")
             
-            params = self._convert_to_valuation_params(inputs)
+            if params is None:
+                params = self._convert_to_valuation_params(inputs)
             
             # Convert comparable multiples to DataFrame format
             comps_data = []
@@ -477,13 +528,15 @@ class FinancialValuationEngine:
                     "range": [0.0, 0.0]
                 }
             
-            # Get base metrics used
+            # Get base metrics used (terminal-year values as Python floats)
+            terminal_revenue = float(params.revenue_projections[-1])
+            terminal_depreciation = float(params.depreciation_expense[-1])
             base_metrics = {
-                "ebitda": round(params.revenue_projections[-1] * params.ebit_margin + params.depreciation_expense[-1], 1),
-                "fcf": round(params.revenue_projections[-1] * params.ebit_margin * (1 - params.corporate_tax_rate) + 
-                           params.depreciation_expense[-1] - params.capital_expenditure[-1] - params.net_working_capital_changes[-1], 1),
-                "revenue": round(params.revenue_projections[-1], 1),
-                "net_income": round(params.revenue_projections[-1] * params.ebit_margin * (1 - params.corporate_tax_rate), 1)
+                "ebitda": round(terminal_revenue * params.ebit_margin + terminal_depreciation, 1),
+                "fcf": round(terminal_revenue * params.ebit_margin * (1 - params.corporate_tax_rate) + 
+                           terminal_depreciation - float(params.capital_expenditure[-1]) - float(params.net_working_capital_changes[-1]), 1),
+                "revenue": round(terminal_revenue, 1),
+                "net_income": round(terminal_revenue * params.ebit_margin * (1 - params.corporate_tax_rate), 1)
             }
             
             # Calculate implied EVs by multiple type
@@ -525,7 +578,8 @@ class FinancialValuationEngine:
             else:
                 raise create_error("DCF_CALCULATION_FAILED", reason=f"Comparable multiples analysis failed: {str(e)}")
     
-    def perform_scenario_analysis(self, inputs: FinancialInputs) -> Dict[str, Any]:
+    def perform_scenario_analysis(self, inputs: FinancialInputs,
+                                  params: Optional[ValuationParameters] = None) -> Dict[str, Any]:
         """
         Perform scenario analysis to evaluate valuation under different assumptions.
         
@@ -542,6 +596,7 @@ class FinancialValuationEngine:
         
         Args:
             inputs: FinancialInputs object containing base case data and scenario definitions
+            params: ValuationParameters already converted from inputs (converted here if omitted)
             
         Returns:
             Dict containing:
@@ -558,7 +613,8 @@ class FinancialValuationEngine:
             if not inputs.scenarios:
                 raise create_error("INVALID_SCENARIO_DEFINITION", reason="No scenario definitions provided")
             
-            params = self._convert_to_valuation_params(inputs)
+            if params is None:
+                params = self._convert_to_valuation_params(inputs)
             scenarios_df = perform_scenario_analysis(params)
             
             scenarios = {}
@@ -590,7 +646,8 @@ class FinancialValuationEngine:
             else:
                 raise create_error("DCF_CALCULATION_FAILED", reason=f"Scenario analysis failed: {str(e)}")
     
-    def perform_sensitivity_analysis(self, inputs: FinancialInputs) -> Dict[str, Any]:
+    def perform_sensitivity_analysis(self, inputs: FinancialInputs,
+                                     params: Optional[ValuationParameters] = None) -> Dict[str, Any]:
         """
         Perform sensitivity analysis to understand parameter impact on valuation.
         
@@ -608,6 +665,7 @@ class FinancialValuationEngine:
         
         Args:
             inputs: FinancialInputs object containing base case data and sensitivity ranges
+            params: ValuationParameters already converted from inputs (converted here if omitted)
             
         Returns:
             Dict containing:
@@ -623,7 +681,8 @@ class FinancialValuationEngine:
             if not inputs.sensitivity_analysis:
                 raise create_error("INVALID_MONTE_CARLO_SPECS", reason="No sensitivity analysis ranges provided")
             
-            params = self._convert_to_valuation_params(inputs)
+            if params is None:
+                params = self._convert_to_valuation_params(inputs)
             sensitivity_df = perform_sensitivity_analysis(params)
             
             sensitivity = {}
@@ -666,7 +725,8 @@ class FinancialValuationEngine:
             else:
                 raise create_error("DCF_CALCULATION_FAILED", reason=f"Sensitivity analysis failed: {str(e)}")
     
-    def simulate_monte_carlo(self, inputs: FinancialInputs, runs: int = 1000) -> Dict[str, Any]:
+    def simulate_monte_carlo(self, inputs: FinancialInputs, runs: int = 1000,
+                             params: Optional[ValuationParameters] = None) -> Dict[str, Any]:
         """
         Perform Monte Carlo simulation for risk analysis and uncertainty quantification.
         
@@ -685,6 +745,7 @@ class FinancialValuationEngine:
         Args:
             inputs: FinancialInputs object containing base case data and Monte Carlo specifications
             runs: Number of simulation runs (default: 1000)
+            params: ValuationParameters already converted from inputs (converted here if omitted)
             
         Returns:
             Dict containing:
@@ -702,7 +763,8 @@ class FinancialValuationEngine:
             if not inputs.monte_carlo_specs:
                 raise create_error("INVALID_MONTE_CARLO_SPECS", reason="No Monte Carlo specifications provided")
             
-            params = self._convert_to_valuation_params(inputs)
+            if params is None:
+                params = self._convert_to_valuation_params(inputs)
             # Use a deterministic random seed so API and local produce identical results
             seed = None
             if inputs.monte_carlo_specs and isinstance(inputs.monte_carlo_specs, dict):
@@ -791,15 +853,19 @@ class FinancialValuationEngine:
             "monte_carlo_simulation": {}
         }
         
+        # Convert the inputs once and share the parameters across the analyses below;
+        # none of them mutates it (scenarios, sensitivity and Monte Carlo vary copies)
+        params = self._convert_to_valuation_params(inputs)
+        
         # Run DCF
-        dcf_result = self.calculate_dcf_valuation(inputs)
+        dcf_result = self.calculate_dcf_valuation(inputs, params=params)
         if "error" not in dcf_result:
             results["dcf_valuation"] = dcf_result
         else:
             results["dcf_valuation"] = {"error": dcf_result.get("error", "Unknown error")}
         
         # Run APV
-        apv_result = self.calculate_apv_valuation(inputs)
+        apv_result = self.calculate_apv_valuation(inputs, params=params)
         if "error" not in apv_result:
             results["apv_valuation"] = apv_result
         else:
@@ -807,7 +873,7 @@ class FinancialValuationEngine:
         
         # Run Comparable Multiples
         if inputs.comparable_multiples:
-            multiples_result = self.analyze_comparable_multiples(inputs)
+            multiples_result = self.analyze_comparable_multiples(inputs, params=params)
             if "error" not in multiples_result:
                 results["comparable_valuation"] = multiples_result
             else:
@@ -815,7 +881,7 @@ class FinancialValuationEngine:
         
         # Run Scenario Analysis
         if inputs.scenarios:
-            scenario_result = self.perform_scenario_analysis(inputs)
+            scenario_result = self.perform_scenario_analysis(inputs, params=params)
             if not isinstance(scenario_result, dict) or "error" not in scenario_result:
                 results["scenarios"] = scenario_result
             else:
@@ -823,7 +889,7 @@ class FinancialValuationEngine:
         
         # Run Sensitivity Analysis
         if inputs.sensitivity_analysis:
-            sensitivity_result = self.perform_sensitivity_analysis(inputs)
+            sensitivity_result = self.perform_sensitivity_analysis(inputs, params=params)
             if not isinstance(sensitivity_result, dict) or "error" not in sensitivity_result:
                 results["sensitivity_analysis"] = sensitivity_result
             else:
@@ -833,7 +899,7 @@ class FinancialValuationEngine:
         if inputs.monte_carlo_specs:
             # Get runs from monte_carlo_specs or use default
             runs = inputs.monte_carlo_specs.get("runs", 1000)
-            monte_carlo_result = self.simulate_monte_carlo(inputs, runs=runs)
+            monte_carlo_result = self.simulate_monte_carlo(inputs, runs=runs, params=params)
             if "error" not in monte_carlo_result:
                 results["monte_carlo_simulation"] = monte_carlo_result
             else:
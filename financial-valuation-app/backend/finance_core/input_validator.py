@@ -1,7 +1,99 @@
 """Input validation for financial valuation data."""
 
-from typing import Dict, List, Any, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
 import warnings
+import numpy as np
+
+def _check_normal_params(variable: str, params: Dict[str, Any]) -> List[str]:
+    """Check the parameters of a normal distribution spec."""
+    warnings = []
+    if params['std'] <= 0:
+        warnings.append(f"Standard deviation for {variable} must be positive: {params['std']}")
+    if abs(params['mean']) > 1:
+        warnings.append(f"Mean for {variable} seems large: {params['mean']}")
+    return warnings
+
+def _check_uniform_params(variable: str, params: Dict[str, Any]) -> List[str]:
+    """Check the parameters of a uniform distribution spec."""
+    if params['min'] >= params['max']:
+        return [f"Minimum for {variable} must be less than maximum: {params['min']} >= {params['max']}"]
+    return []
+
+def _check_lognormal_params(variable: str, params: Dict[str, Any]) -> List[str]:
+    """Check the parameters of a lognormal distribution spec."""
+    std = params.get('std', 1)
+    if std <= 0:
+        return [f"Standard deviation for {variable} must be positive: {std}"]
+    return []
+
+def _check_triangular_params(variable: str, params: Dict[str, Any]) -> List[str]:
+    """Check the parameters of a triangular distribution spec."""
+    low, high = params['min'], params['max']
+    if low >= high:
+        return [f"Minimum for {variable} must be less than maximum: {low} >= {high}"]
+    mode = params.get('mode')
+    if mode is not None and not low <= mode <= high:
+        return [f"Mode for {variable} must lie between minimum and maximum: {mode}"]
+    return []
+
+def _finite_float_array(values: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a list of values to float64 without coercing bad entries.
+    
+    Only real numbers that are finite are converted; None, strings, booleans, NaN
+    and infinities become NaN and are marked invalid in the returned mask.
+    
+    Returns:
+        Tuple of (float64 array, boolean mask of valid entries)
+    """
+    valid = np.fromiter(
+        (isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+         and bool(np.isfinite(value)) for value in values),
+        dtype=bool, count=len(values)
+    )
+    array = np.array([value if ok else np.nan for value, ok in zip(values, valid)], dtype=np.float64)
+    return array, valid
+
+# Fields every financial input must provide, in reporting order, plus a set for membership tests
+_REQUIRED_FIELDS: Tuple[str, ...] = (
+    'revenue', 'ebit_margin', 'tax_rate', 'capex', 'depreciation', 
+    'nwc_changes', 'weighted_average_cost_of_capital', 'terminal_growth_rate',
+    'share_count', 'cost_of_debt'
+)
+_REQUIRED_FIELD_SET: FrozenSet[str] = frozenset(_REQUIRED_FIELDS)
+
+# Distribution name -> (required parameter names, parameter check). Optional
+# parameters mirror the defaults applied in monte_carlo.generate_random_samples.
+_MONTE_CARLO_SCHEMAS: Dict[str, Tuple[FrozenSet[str], Callable[[str, Dict[str, Any]], List[str]]]] = {
+    'normal': (frozenset(('mean', 'std')), _check_normal_params),
+    'uniform': (frozenset(('min', 'max')), _check_uniform_params),
+    'lognormal': (frozenset(), _check_lognormal_params),
+    'triangular': (frozenset(('min', 'max')), _check_triangular_params),
+}
+
+# (predicate, message template) pairs for terminal growth vs. WACC; a message is
+# only formatted when its predicate fires
+_GROWTH_ASSUMPTION_CHECKS: Tuple[Tuple[Callable[[float, float], bool], str], ...] = (
+    (lambda tg, wacc: tg < 0, "Terminal growth rate should be non-negative: {tg:.1%}"),
+    (lambda tg, wacc: tg > 0.05, "Terminal growth rate seems high: {tg:.1%}"),
+    (lambda tg, wacc: tg >= wacc, "Terminal growth ({tg:.1%}) must be less than WACC ({wacc:.1%})"),
+)
+
+# Parameter name -> (out-of-range predicate, label) shared by the scenario and
+# sensitivity checks; parameters not listed here are not range-checked
+_PARAMETER_RANGE_CHECKS: Dict[str, Tuple[Callable[[float], bool], str]] = {
+    'ebit_margin': (lambda value: value <= 0 or value > 0.5, "EBIT margin"),
+    'terminal_growth_rate': (lambda value: value < 0 or value > 0.05, "terminal growth"),
+    'weighted_average_cost_of_capital': (lambda value: value < 0.05 or value > 0.25, "WACC"),
+}
+
+def _growth_assumption_warnings(terminal_growth: float, wacc: float) -> List[str]:
+    """Return the terminal growth warnings for a (terminal growth, WACC) pair."""
+    return [
+        message.format(tg=terminal_growth, wacc=wacc)
+        for check, message in _GROWTH_ASSUMPTION_CHECKS
+        if check(terminal_growth, wacc)
+    ]
 
 class InputValidator:
     """Comprehensive input validator for financial valuation data."""
@@ -61,21 +153,14 @@ class InputValidator:
     @staticmethod
     def _validate_basic_data(data: Dict[str, Any]) -> List[str]:
         """Validate basic data completeness and types."""
-        warnings = []
+        # One set difference finds the absent fields; only present fields are checked for None
+        missing = _REQUIRED_FIELD_SET.difference(data)
         
-        required_fields = [
-            'revenue', 'ebit_margin', 'tax_rate', 'capex', 'depreciation', 
-            'nwc_changes', 'weighted_average_cost_of_capital', 'terminal_growth_rate',
-            'share_count', 'cost_of_debt'
+        return [
+            f"Missing required field: {field}" if field in missing else f"Required field is None: {field}"
+            for field in _REQUIRED_FIELDS
+            if field in missing or data[field] is None
         ]
-        
-        for field in required_fields:
-            if field not in data:
-                warnings.append(f"Missing required field: {field}")
-            elif data[field] is None:
-                warnings.append(f"Required field is None: {field}")
-        
-        return warnings
     
     @staticmethod
     def _validate_revenue_projections(data: Dict[str, Any]) -> List[str]:
@@ -87,18 +172,30 @@ class InputValidator:
             warnings.append("Revenue projections must be a non-empty list")
             return warnings
         
-        # Check for negative revenue
-        for i, rev in enumerate(revenue):
-            if rev <= 0:
-                warnings.append(f"Revenue Year {i+1} must be positive: {rev}")
-        
-        # Check for reasonable growth rates
-        for i in range(1, len(revenue)):
-            growth_rate = (revenue[i] - revenue[i-1]) / revenue[i-1]
-            if growth_rate > 0.5:  # 50% growth
-                warnings.append(f"High revenue growth rate in Year {i+1}: {growth_rate:.1%}")
-            elif growth_rate < -0.3:  # -30% decline
-                warnings.append(f"Large revenue decline in Year {i+1}: {growth_rate:.1%}")
+        revenue_values, numeric = _finite_float_array(revenue)
+        
+        # Check for missing, non-numeric and negative revenue
+        for i in np.flatnonzero(~numeric | (revenue_values <= 0)).tolist():
+            if not numeric[i]:
+                warnings.append(f"Revenue Year {i+1} must be a finite number: {revenue[i]!r}")
+            else:
+                warnings.append(f"Revenue Year {i+1} must be positive: {revenue[i]}")
+        
+        # Check for reasonable growth rates: compute every year-over-year rate in
+        # one pass and only format the flagged years. Years following a zero or
+        # non-numeric revenue have no defined rate and are already flagged above.
+        prior_revenue = revenue_values[:-1]
+        growth_rates = np.divide(
+            np.diff(revenue_values), prior_revenue,
+            out=np.zeros_like(prior_revenue), where=prior_revenue != 0
+        )
+        # 50% growth / -30% decline
+        for i in np.flatnonzero((growth_rates > 0.5) | (growth_rates < -0.3)).tolist():
+            growth_rate = growth_rates[i]
+            if growth_rate > 0.5:
+                warnings.append(f"High revenue growth rate in Year {i+2}: {growth_rate:.1%}")
+            else:
+                warnings.append(f"Large revenue decline in Year {i+2}: {growth_rate:.1%}")
         
         return warnings
     
@@ -139,21 +236,10 @@ class InputValidator:
     @staticmethod
     def _validate_growth_assumptions(data: Dict[str, Any]) -> List[str]:
         """Validate growth and terminal value assumptions."""
-        warnings = []
-        
         terminal_growth = data.get('terminal_growth_rate', 0)
         wacc = data.get('weighted_average_cost_of_capital', 0)
         
-        if terminal_growth < 0:
-            warnings.append(f"Terminal growth rate should be non-negative: {terminal_growth:.1%}")
-        
-        if terminal_growth > 0.05:
-            warnings.append(f"Terminal growth rate seems high: {terminal_growth:.1%}")
-        
-        if terminal_growth >= wacc:
-            warnings.append(f"Terminal growth ({terminal_growth:.1%}) must be less than WACC ({wacc:.1%})")
-        
-        return warnings
+        return _growth_assumption_warnings(terminal_growth, wacc)
     
     @staticmethod
     def _validate_working_capital(data: Dict[str, Any]) -> List[str]:
@@ -167,12 +253,23 @@ class InputValidator:
             warnings.append("NWC changes must have same length as revenue projections")
             return warnings
         
-        # Check NWC changes as percentage of revenue
-        for i, nwc_change in enumerate(nwc_changes):
-            if revenue[i] > 0:
-                nwc_ratio = abs(nwc_change) / revenue[i]
-                if nwc_ratio > 0.15:  # 15% of revenue
-                    warnings.append(f"Large NWC change in Year {i+1}: {nwc_ratio:.1%} of revenue")
+        # Check NWC changes as percentage of revenue, for years with positive revenue;
+        # years where either value is not a finite number cannot be checked
+        nwc_values, nwc_numeric = _finite_float_array(nwc_changes)
+        revenue_values, revenue_numeric = _finite_float_array(revenue)
+        comparable = nwc_numeric & revenue_numeric
+        nwc_ratios = np.divide(
+            np.abs(nwc_values), revenue_values,
+            out=np.zeros_like(revenue_values), where=comparable & (revenue_values > 0)
+        )
+        for i in np.flatnonzero(~comparable | (nwc_ratios > 0.15)).tolist():  # 15% of revenue
+            if not comparable[i]:
+                warnings.append(
+                    f"NWC change in Year {i+1} cannot be checked: NWC change {nwc_changes[i]!r} "
+                    f"and revenue {revenue[i]!r} must be finite numbers"
+                )
+            else:
+                warnings.append(f"Large NWC change in Year {i+1}: {nwc_ratios[i]:.1%} of revenue")
         
         return warnings
     
@@ -186,12 +283,18 @@ class InputValidator:
                 warnings.append(f"Comparable multiples for {multiple_type} must be non-empty list")
                 continue
             
-            # Check for reasonable multiple ranges
-            for i, value in enumerate(values):
-                if value <= 0:
-                    warnings.append(f"Multiple {multiple_type} #{i+1} must be positive: {value}")
-                elif value > 100:  # Very high multiple
-                    warnings.append(f"Very high multiple {multiple_type} #{i+1}: {value}")
+            multiples_array, numeric = _finite_float_array(values)
+            
+            # Check for reasonable multiple ranges; only flagged peers are formatted
+            non_positive = multiples_array <= 0
+            very_high = multiples_array > 100  # Very high multiple
+            for i in np.flatnonzero(~numeric | non_positive | very_high).tolist():
+                if not numeric[i]:
+                    warnings.append(f"Multiple {multiple_type} #{i+1} must be numeric: {values[i]!r}")
+                elif non_positive[i]:
+                    warnings.append(f"Multiple {multiple_type} #{i+1} must be positive: {values[i]}")
+                else:
+                    warnings.append(f"Very high multiple {multiple_type} #{i+1}: {values[i]}")
         
         return warnings
     
@@ -207,12 +310,9 @@ class InputValidator:
             
             # Validate scenario parameters
             for param, value in scenario_data.items():
-                if param == 'ebit_margin' and (value <= 0 or value > 0.5):
-                    warnings.append(f"Scenario {scenario_name} EBIT margin seems unreasonable: {value:.1%}")
-                elif param == 'terminal_growth_rate' and (value < 0 or value > 0.05):
-                    warnings.append(f"Scenario {scenario_name} terminal growth seems unreasonable: {value:.1%}")
-                elif param == 'weighted_average_cost_of_capital' and (value < 0.05 or value > 0.25):
-                    warnings.append(f"Scenario {scenario_name} WACC seems unreasonable: {value:.1%}")
+                range_check = _PARAMETER_RANGE_CHECKS.get(param)
+                if range_check is not None and range_check[0](value):
+                    warnings.append(f"Scenario {scenario_name} {range_check[1]} seems unreasonable: {value:.1%}")
         
         return warnings
     
@@ -229,16 +329,18 @@ class InputValidator:
             distribution = spec.get('distribution')
             params = spec.get('params', {})
             
-            if distribution not in ['normal', 'uniform', 'lognormal', 'triangular']:
+            schema = _MONTE_CARLO_SCHEMAS.get(distribution)
+            if schema is None:
                 warnings.append(f"Unsupported distribution for {variable}: {distribution}")
+                continue
             
-            if distribution == 'normal':
-                mean = params.get('mean')
-                std = params.get('std')
-                if std <= 0:
-                    warnings.append(f"Standard deviation for {variable} must be positive: {std}")
-                if abs(mean) > 1:
-                    warnings.append(f"Mean for {variable} seems large: {mean}")
+            required, check = schema
+            missing = required - params.keys()
+            if missing:
+                warnings.append(f"Monte Carlo spec for {variable} is missing parameters: {', '.join(sorted(missing))}")
+                continue
+            
+            warnings.extend(check(variable, params))
         
         return warnings
     
@@ -252,13 +354,13 @@ class InputValidator:
                 warnings.append(f"Sensitivity analysis for {variable} must be non-empty list")
                 continue
             
-            # Check for reasonable ranges
+            # Check for reasonable ranges; the check is resolved once per variable
+            range_check = _PARAMETER_RANGE_CHECKS.get(variable)
+            if range_check is None:
+                continue
+            is_unreasonable, label = range_check
             for i, value in enumerate(values):
-                if variable == 'ebit_margin' and (value <= 0 or value > 0.5):
-                    warnings.append(f"Sensitivity EBIT margin #{i+1} seems unreasonable: {value:.1%}")
-                elif variable == 'terminal_growth_rate' and (value < 0 or value > 0.05):
-                    warnings.append(f"Sensitivity terminal growth #{i+1} seems unreasonable: {value:.1%}")
-                elif variable == 'weighted_average_cost_of_capital' and (value < 0.05 or value > 0.25):
-                    warnings.append(f"Sensitivity WACC #{i+1} seems unreasonable: {value:.1%}")
+                if is_unreasonable(value):
+                    warnings.append(f"Sensitivity {label} #{i+1} seems unreasonable: {value:.1%}")
         
         return warnings 
\ No newline at end of file
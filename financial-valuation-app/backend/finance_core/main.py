@@ -4,93 +4,102 @@ import os
 import csv
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 from .finance_calculator import FinancialValuationEngine, parse_financial_inputs
 from .input_validator import InputValidator
 from .csv_to_json_converter import csv_to_json
 
-def generate_csv_report(input_data, results_data, company_name):
-    """Generate CSV report inline."""
-    report = []
+# Number of projection years shown in the CSV report
+PROJECTION_YEARS = 5
+
+def _pad_projection(values, years):
+    """Return the first `years` values as a float array, zero-filled past the end of `values`."""
+    series = np.zeros(years, dtype=np.float64)
+    available = min(len(values), years)
+    series[:available] = values[:available]
+    return series
+
+def iter_csv_report(input_data, results_data, company_name):
+    """Yield the CSV report rows one at a time, so they can be written as they are produced."""
+    # Resolve the nested sections once
+    financial_inputs = input_data.get('financial_inputs') or {}
+    cost_of_capital = financial_inputs.get('cost_of_capital') or {}
+    dcf_results = results_data.get('dcf_valuation') or {}
+    apv_results = results_data.get('apv_valuation') or {}
+    comp_results = results_data.get('comparable_valuation') or {}
+    wacc_components = dcf_results.get('wacc_components') or {}
+    mc_wacc_method = (results_data.get('monte_carlo_simulation') or {}).get('wacc_method') or {}
+    today = datetime.now().strftime('%Y-%m-%d')
     
     # Company information
-    report.extend([
+    yield from [
         ["COMPANY INFORMATION"],
         ["Metric", "Value"],
         ["Company", company_name],
-        ["Valuation Date", input_data.get('valuation_date', datetime.now().strftime('%Y-%m-%d'))],
-        ["Report Date", datetime.now().strftime('%Y-%m-%d')],
+        ["Valuation Date", input_data.get('valuation_date', today)],
+        ["Report Date", today],
         [""],
         
         ["KEY METRICS"],
         ["Metric", "Value"],
-        ["Tax Rate", f"{input_data.get('financial_inputs', {}).get('tax_rate', 0):.1%}"],
-        ["Terminal Growth", f"{input_data.get('financial_inputs', {}).get('terminal_growth_rate', 0):.1%}"],
-        ["Share Count (M)", f"{input_data.get('financial_inputs', {}).get('share_count', 0):.1f}"],
-        ["WACC", f"{input_data.get('financial_inputs', {}).get('weighted_average_cost_of_capital', 0):.1%}"],
-        ["Cost of Equity", f"{results_data.get('dcf_valuation', {}).get('wacc_components', {}).get('cost_of_equity', 0):.1%}"],
-        ["Cost of Debt", f"{input_data.get('financial_inputs', {}).get('cost_of_debt', 0):.1%}"],
-        ["Target Debt Ratio", f"{input_data.get('financial_inputs', {}).get('cost_of_capital', {}).get('target_debt_to_value_ratio', 0):.1%}"],
-        ["Risk Free Rate", f"{input_data.get('financial_inputs', {}).get('cost_of_capital', {}).get('risk_free_rate', 0):.1%}"],
-        ["Market Risk Premium", f"{input_data.get('financial_inputs', {}).get('cost_of_capital', {}).get('market_risk_premium', 0):.1%}"],
-        ["Levered Beta", f"{input_data.get('financial_inputs', {}).get('cost_of_capital', {}).get('levered_beta', 0):.1f}"],
-        ["Cash Balance ($M)", f"{input_data.get('financial_inputs', {}).get('cash_balance', 0):.1f}"],
+        ["Tax Rate", f"{financial_inputs.get('tax_rate', 0):.1%}"],
+        ["Terminal Growth", f"{financial_inputs.get('terminal_growth_rate', 0):.1%}"],
+        ["Share Count (M)", f"{financial_inputs.get('share_count', 0):.1f}"],
+        ["WACC", f"{financial_inputs.get('weighted_average_cost_of_capital', 0):.1%}"],
+        ["Cost of Equity", f"{wacc_components.get('cost_of_equity', 0):.1%}"],
+        ["Cost of Debt", f"{financial_inputs.get('cost_of_debt', 0):.1%}"],
+        ["Target Debt Ratio", f"{cost_of_capital.get('target_debt_to_value_ratio', 0):.1%}"],
+        ["Risk Free Rate", f"{cost_of_capital.get('risk_free_rate', 0):.1%}"],
+        ["Market Risk Premium", f"{cost_of_capital.get('market_risk_premium', 0):.1%}"],
+        ["Levered Beta", f"{cost_of_capital.get('levered_beta', 0):.1f}"],
+        ["Cash Balance ($M)", f"{financial_inputs.get('cash_balance', 0):.1f}"],
         [""],
         
         ["FINANCIAL PROJECTIONS"],
         ["Metric", "Year 1", "Year 2", "Year 3", "Year 4", "Year 5"]
-    ])
+    ]
     
     # Financial projections
-    revenue = input_data.get('financial_inputs', {}).get('revenue', [])
-    ebit_margin = input_data.get('financial_inputs', {}).get('ebit_margin', 0)
-    tax_rate = input_data.get('financial_inputs', {}).get('tax_rate', 0)
-    depreciation = input_data.get('financial_inputs', {}).get('depreciation', [])
-    capex = input_data.get('financial_inputs', {}).get('capex', [])
-    nwc_changes = input_data.get('financial_inputs', {}).get('nwc_changes', [])
-    
-    # Calculate projections
-    for i in range(5):
-        if i < len(revenue):
-            rev = revenue[i]
-            ebit = rev * ebit_margin
-            taxes = ebit * tax_rate
-            nopat = ebit - taxes
-            dep = depreciation[i] if i < len(depreciation) else 0
-            cap_ex = capex[i] if i < len(capex) else 0
-            nwc = nwc_changes[i] if i < len(nwc_changes) else 0
-            fcf = nopat + dep - cap_ex - nwc
-            
-            if i == 0:
-                report.extend([
-                    ["Revenue ($M)", f"{rev:.1f}", "", "", "", ""],
-                    ["EBIT ($M)", f"{ebit:.1f}", "", "", "", ""],
-                    ["EBIT Margin (%)", f"{ebit_margin:.1%}", "", "", "", ""],
-                    ["Taxes ($M)", f"{taxes:.2f}", "", "", "", ""],
-                    ["NOPAT ($M)", f"{nopat:.2f}", "", "", "", ""],
-                    ["Depreciation & Amortization ($M)", f"{dep:.1f}", "", "", "", ""],
-                    ["CapEx ($M)", f"{cap_ex:.1f}", "", "", "", ""],
-                    ["Change in NWC ($M)", f"{nwc:.1f}", "", "", "", ""],
-                    ["UFCF ($M)", f"{fcf:.1f}", "", "", "", ""]
-                ])
-            else:
-                report[-(9):] = [
-                    ["Revenue ($M)", f"{rev:.1f}"],
-                    ["EBIT ($M)", f"{ebit:.1f}"],
-                    ["EBIT Margin (%)", f"{ebit_margin:.1%}"],
-                    ["Taxes ($M)", f"{taxes:.2f}"],
-                    ["NOPAT ($M)", f"{nopat:.2f}"],
-                    ["Depreciation & Amortization ($M)", f"{dep:.1f}"],
-                    ["CapEx ($M)", f"{cap_ex:.1f}"],
-                    ["Change in NWC ($M)", f"{nwc:.1f}"],
-                    ["UFCF ($M)", f"{fcf:.1f}"]
-                ]
+    revenue = financial_inputs.get('revenue', [])
+    ebit_margin = financial_inputs.get('ebit_margin', 0)
+    tax_rate = financial_inputs.get('tax_rate', 0)
+    depreciation = financial_inputs.get('depreciation', [])
+    capex = financial_inputs.get('capex', [])
+    nwc_changes = financial_inputs.get('nwc_changes', [])
+    
+    # Calculate projections for up to five years at once; missing
+    # depreciation/CapEx/NWC years count as zero, as before
+    years = min(len(revenue), PROJECTION_YEARS)
+    if years:
+        rev = np.asarray(revenue[:years], dtype=np.float64)
+        ebit = rev * ebit_margin
+        taxes = ebit * tax_rate
+        nopat = ebit - taxes
+        dep = _pad_projection(depreciation, years)
+        cap_ex = _pad_projection(capex, years)
+        nwc = _pad_projection(nwc_changes, years)
+        fcf = nopat + dep - cap_ex - nwc
+        
+        # One row per metric, with blank cells for years without revenue
+        blanks = [""] * (PROJECTION_YEARS - years)
+        projection_rows = [
+            ("Revenue ($M)", rev, ".1f"),
+            ("EBIT ($M)", ebit, ".1f"),
+            ("EBIT Margin (%)", np.full(years, ebit_margin), ".1%"),
+            ("Taxes ($M)", taxes, ".2f"),
+            ("NOPAT ($M)", nopat, ".2f"),
+            ("Depreciation & Amortization ($M)", dep, ".1f"),
+            ("CapEx ($M)", cap_ex, ".1f"),
+            ("Change in NWC ($M)", nwc, ".1f"),
+            ("UFCF ($M)", fcf, ".1f")
+        ]
+        yield from (
+            [label] + [format(value, spec) for value in values.tolist()] + blanks
+            for label, values, spec in projection_rows
+        )
     
     # Valuation results
-    dcf_results = results_data.get('dcf_valuation', {})
-    apv_results = results_data.get('apv_valuation', {})
-    comp_results = results_data.get('comparable_valuation', {})
-    
-    report.extend([
+    yield from [
         [""],
         ["VALUATION RESULTS"],
         ["Method", "Enterprise Value", "Equity Value", "Price per Share"],
@@ -101,86 +110,91 @@ def generate_csv_report(input_data, results_data, company_name):
         
         ["WACC BREAKDOWN"],
         ["Component", "Value"],
-        ["WACC (Input)", f"{input_data.get('financial_inputs', {}).get('weighted_average_cost_of_capital', 0):.1%}"],
-        ["Cost of Equity", f"{dcf_results.get('wacc_components', {}).get('cost_of_equity', 0):.1%}"],
-        ["Cost of Debt", f"{dcf_results.get('wacc_components', {}).get('cost_of_debt', 0):.1%}"],
+        ["WACC (Input)", f"{financial_inputs.get('weighted_average_cost_of_capital', 0):.1%}"],
+        ["Cost of Equity", f"{wacc_components.get('cost_of_equity', 0):.1%}"],
+        ["Cost of Debt", f"{wacc_components.get('cost_of_debt', 0):.1%}"],
         [""],
         
         ["SCENARIO ANALYSIS"],
         ["Scenario", "Price per Share"]
-    ])
+    ]
     
     # Scenarios
     scenarios = results_data.get('scenarios', {}).get('scenarios', {})
     for scenario_name, scenario_data in scenarios.items():
-        report.append([
+        yield [
             scenario_name.replace('_', ' ').title(),
             f"${float(scenario_data.get('price_per_share', 0)):.2f}"
-        ])
+        ]
     
     # Monte Carlo
-    mc_results = results_data.get('monte_carlo_simulation', {})
-    report.extend([
+    confidence_interval_95 = mc_wacc_method.get('confidence_interval_95', [0, 0])
+    yield from [
         [""],
         ["MONTE CARLO SIMULATION"],
         ["Metric", "Value"],
-        ["Mean EV", f"${float(mc_results.get('wacc_method', {}).get('mean_ev', 0)):,.0f}"],
-        ["95% CI Lower", f"${float(mc_results.get('wacc_method', {}).get('confidence_interval_95', [0, 0])[0]):,.0f}"],
-        ["95% CI Upper", f"${float(mc_results.get('wacc_method', {}).get('confidence_interval_95', [0, 0])[1]):,.0f}"]
-    ])
+        ["Mean EV", f"${float(mc_wacc_method.get('mean_ev', 0)):,.0f}"],
+        ["95% CI Lower", f"${float(confidence_interval_95[0]):,.0f}"],
+        ["95% CI Upper", f"${float(confidence_interval_95[1]):,.0f}"]
+    ]
     
     # Add Sensitivity Analysis Tables
     sensitivity_results = results_data.get('sensitivity_analysis', {}).get('sensitivity_results', {})
     if sensitivity_results:
         # EBIT Margin Sensitivity
         if 'ebit_margin' in sensitivity_results:
-            report.extend([
+            yield from [
                 [""],
                 ["EBIT MARGIN SENSITIVITY"],
                 ["EBIT Margin", "Enterprise Value", "Price per Share"]
-            ])
+            ]
             ebit_sensitivity = sensitivity_results['ebit_margin']['ev']
+            get_price = sensitivity_results['ebit_margin']['price_per_share'].get
             for ebit_margin, ev_value in ebit_sensitivity.items():
-                price_value = sensitivity_results['ebit_margin']['price_per_share'].get(ebit_margin, 0)
-                report.append([
+                price_value = get_price(ebit_margin, 0)
+                yield [
                     f"{float(ebit_margin):.1%}",
                     f"${float(ev_value):,.0f}",
                     f"${float(price_value):.2f}"
-                ])
+                ]
         
         # Terminal Growth Sensitivity
         if 'terminal_growth_rate' in sensitivity_results:
-            report.extend([
+            yield from [
                 [""],
                 ["TERMINAL GROWTH SENSITIVITY"],
                 ["Terminal Growth", "Enterprise Value", "Price per Share"]
-            ])
+            ]
             growth_sensitivity = sensitivity_results['terminal_growth_rate']['ev']
+            get_price = sensitivity_results['terminal_growth_rate']['price_per_share'].get
             for growth_rate, ev_value in growth_sensitivity.items():
-                price_value = sensitivity_results['terminal_growth_rate']['price_per_share'].get(growth_rate, 0)
-                report.append([
+                price_value = get_price(growth_rate, 0)
+                yield [
                     f"{float(growth_rate):.1%}",
                     f"${float(ev_value):,.0f}",
                     f"${float(price_value):.2f}"
-                ])
+                ]
         
         # WACC Sensitivity
         if 'weighted_average_cost_of_capital' in sensitivity_results:
-            report.extend([
+            yield from [
                 [""],
                 ["WACC SENSITIVITY"],
                 ["WACC", "Enterprise Value", "Price per Share"]
-            ])
+            ]
             wacc_sensitivity = sensitivity_results['weighted_average_cost_of_capital']['ev']
+            get_price = sensitivity_results['weighted_average_cost_of_capital']['price_per_share'].get
             for wacc, ev_value in wacc_sensitivity.items():
-                price_value = sensitivity_results['weighted_average_cost_of_capital']['price_per_share'].get(wacc, 0)
-                report.append([
+                price_value = get_price(wacc, 0)
+                yield [
                     f"{float(wacc):.1%}",
                     f"${float(ev_value):,.0f}",
                     f"${float(price_value):.2f}"
-                ])
-    
-    return report
+                ]
+
+def generate_csv_report(input_data, results_data, company_name):
+    """Generate CSV report inline."""
+    return list(iter_csv_report(input_data, results_data, company_name))
 
 def run_valuation_workflow(input_csv="valuation_input.csv"):
     """Run the complete valuation workflow from CSV input to CSV output."""
@@ -204,13 +218,13 @@ def run_valuation_workflow(input_csv="valuation_input.csv"):
     
     # Generate report
     company_name = input_data.get('company_name', 'Unknown Company')
-    report_data = generate_csv_report(input_data, results_data, company_name)
-    
     output_file = f"{company_name.replace(' ', '_')}_Valuation_Report.csv"
     
-    with open(output_file, 'w', newline='', encoding='utf-8') as file:
+    # Stream the rows straight into the writer rather than building the whole report first;
+    # a 1 MB buffer keeps large sensitivity tables from turning into many small writes
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as file:
         writer = csv.writer(file)
-        writer.writerows(report_data)
+        writer.writerows(iter_csv_report(input_data, results_data, company_name))
     
     return output_file
 
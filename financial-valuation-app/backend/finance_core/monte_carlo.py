@@ -5,7 +5,6 @@ Barebones Monte Carlo simulation without extra dependencies.
 """
 
 import warnings
-import copy
 from typing import Dict, List, Any, Optional
 import numpy as np
 import pandas as pd
@@ -16,37 +15,37 @@ warnings.filterwarnings('ignore', category=FutureWarning, module='pandas')
 from .params import ValuationParameters
 from .dcf import calculate_dcf_valuation_wacc, calculate_adjusted_present_value
 
-def create_parameter_copy(params: ValuationParameters) -> ValuationParameters:
-    """Create a copy of parameters for Monte Carlo."""
-    return copy.deepcopy(params)
-
-def generate_random_samples(params: ValuationParameters, runs: int) -> Dict[str, np.ndarray]:
-    """Pre-generate all random samples for efficiency."""
+def generate_random_samples(params: ValuationParameters, runs: int,
+                            rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """Pre-generate all random samples for efficiency, drawing each variable's runs in one call."""
+    if rng is None:
+        rng = np.random.default_rng()
+    
     samples = {}
     for name, spec in params.monte_carlo_variable_specs.items():
         dist = spec.get("distribution")
         p = spec.get("params", {})
         
         if dist == "normal":
-            samples[name] = np.random.normal(
+            samples[name] = rng.normal(
                 loc=p.get("mean"), 
                 scale=p.get("std"),
                 size=runs
             )
         elif dist == "uniform":
-            samples[name] = np.random.uniform(
+            samples[name] = rng.uniform(
                 low=p.get("min"), 
                 high=p.get("max"),
                 size=runs
             )
         elif dist == "lognormal":
-            samples[name] = np.random.lognormal(
+            samples[name] = rng.lognormal(
                 mean=p.get("mean", 0),
                 sigma=p.get("std", 1),
                 size=runs
             )
         elif dist == "triangular":
-            samples[name] = np.random.triangular(
+            samples[name] = rng.triangular(
                 left=p.get("min"),
                 mode=p.get("mode", (p.get("min") + p.get("max")) / 2),
                 right=p.get("max"),
@@ -61,13 +60,10 @@ def run_single_iteration(params: ValuationParameters, sample_values: Dict[str, f
                         method: str) -> Optional[Dict[str, float]]:
     """Run a single Monte Carlo iteration."""
     try:
-        # Create parameter copy
-        p = create_parameter_copy(params)
-        
-        # Apply random values
-        for name, value in sample_values.items():
-            if hasattr(p, name):
-                setattr(p, name, value)
+        # Create parameter copy with the random values applied
+        p = params._unchecked_clone(
+            **{name: value for name, value in sample_values.items() if hasattr(params, name)}
+        )
         
         # Run valuation
         if method == "WACC":
@@ -87,7 +83,8 @@ def run_single_iteration(params: ValuationParameters, sample_values: Dict[str, f
         return None
 
 def simulate_monte_carlo(params: ValuationParameters, runs: int, 
-                        random_seed: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+                        random_seed: Optional[int] = None,
+                        rng: Optional[np.random.Generator] = None) -> Dict[str, pd.DataFrame]:
     """
     Run Monte Carlo simulation for valuation uncertainty analysis.
     
@@ -102,9 +99,10 @@ def simulate_monte_carlo(params: ValuationParameters, runs: int,
         if not hasattr(params, name):
             raise ValueError(f"Variable '{name}' in monte_carlo_variable_specs does not exist in ValuationParameters.")
     
-    # Set random seed for reproducibility
-    if random_seed is not None:
-        np.random.seed(random_seed)
+    # Use a local generator (seeded for reproducibility) rather than the global
+    # NumPy random state, so concurrent simulations do not interfere
+    if rng is None:
+        rng = np.random.default_rng(random_seed)
     
     # Determine which valuation methods to use
     methods = []
@@ -117,7 +115,7 @@ def simulate_monte_carlo(params: ValuationParameters, runs: int,
         raise ValueError("No valid valuation methods available (need weighted_average_cost_of_capital for WACC or unlevered_cost_of_equity for APV)")
     
     # Generate random samples
-    samples = generate_random_samples(params, runs)
+    samples = generate_random_samples(params, runs, rng)
     
     # Initialize results storage
     result_dfs = {}
@@ -22,6 +22,41 @@ def calculate_ebitda(ebit: float, depreciation: float) -> float:
     """Calculate EBITDA = EBIT + Depreciation"""
     return ebit + depreciation
 
+def _compute_metric_map(
+    revenues: np.ndarray,
+    capital_expenditure: np.ndarray,
+    depreciation_expense: np.ndarray,
+    net_working_capital_changes: np.ndarray,
+    ebit_margin: float,
+    corporate_tax_rate: float,
+    cost_of_debt: float,
+    terminal_debt: float
+) -> Dict[str, float]:
+    """Compute our company's last-year metrics keyed by multiple denominator."""
+    ebits = project_ebit_series(revenues, ebit_margin)
+    fcfs = project_free_cash_flow(
+        revenues,
+        ebits,
+        capital_expenditure,
+        depreciation_expense,
+        net_working_capital_changes,
+        corporate_tax_rate
+    )
+    
+    terminal_ebit = float(ebits[-1])
+    net_income = calculate_net_income(terminal_ebit, terminal_debt, cost_of_debt, corporate_tax_rate)
+    
+    return {
+        "EBITDA": calculate_ebitda(
+            terminal_ebit, 
+            float(depreciation_expense[-1]) if len(depreciation_expense) else 0.0
+        ),
+        "Earnings": net_income,
+        "E": net_income,
+        "FCF": float(fcfs[-1]),
+        "Revenue": float(revenues[-1])
+    }
+
 def analyze_comparable_multiples(params: ValuationParameters, comps: pd.DataFrame) -> pd.DataFrame:
     """
     Perform comparable multiples analysis using peer company data.
@@ -32,48 +67,26 @@ def analyze_comparable_multiples(params: ValuationParameters, comps: pd.DataFram
     if comps.empty:
         raise ValueError("Comparable companies DataFrame is empty")
     
-    if not params.revenue_projections:
+    if len(params.revenue_projections) == 0:
         raise ValueError("Revenue projections required for multiples analysis")
     
-    # 1) Compute our company's last-year metrics
-    revenues = params.revenue_projections
-    ebits = project_ebit_series(revenues, params.ebit_margin)
-    fcfs = project_free_cash_flow(
-        revenues,
-        ebits,
-        params.capital_expenditure,
-        params.depreciation_expense,
-        params.net_working_capital_changes,
-        params.corporate_tax_rate
-    )
-    
     # Get terminal debt for Net Income calculation
     terminal_debt = None
-    if params.debt_schedule and params.revenue_projections:
+    if params.debt_schedule and len(params.revenue_projections):
         terminal_year = len(params.revenue_projections) - 1
         terminal_debt = params.debt_schedule.get(terminal_year, None)
     
-    # Calculate key financial metrics
-    metric_map = {
-        "EBITDA": calculate_ebitda(
-            ebits[-1], 
-            params.depreciation_expense[-1] if params.depreciation_expense else 0.0
-        ),
-        "Earnings": calculate_net_income(
-            ebits[-1], 
-            terminal_debt if terminal_debt is not None else 0.0, 
-            params.cost_of_debt, 
-            params.corporate_tax_rate
-        ),
-        "E": calculate_net_income(
-            ebits[-1], 
-            terminal_debt if terminal_debt is not None else 0.0, 
-            params.cost_of_debt, 
-            params.corporate_tax_rate
-        ),
-        "FCF": fcfs[-1],
-        "Revenue": revenues[-1]
-    }
+    # 1) Compute our company's last-year metrics
+    metric_map = _compute_metric_map(
+        params.revenue_projections,
+        params.capital_expenditure,
+        params.depreciation_expense,
+        params.net_working_capital_changes,
+        params.ebit_margin,
+        params.corporate_tax_rate,
+        params.cost_of_debt,
+        terminal_debt if terminal_debt is not None else 0.0
+    )
     
     # 2) Apply peer multiples to our metrics
     results = []
@@ -92,28 +105,25 @@ def analyze_comparable_multiples(params: ValuationParameters, comps: pd.DataFram
             if our_metric <= 0:
                 continue  # Skip if our metric is non-positive
             
-            # Clean and convert peer multiples to float
-            peer_vals = comps[col].dropna()
-            if peer_vals.empty:
-                continue
-                
-            # Convert to numeric, handling any non-numeric values
-            peer_vals_numeric = pd.to_numeric(peer_vals, errors='coerce').dropna()
-            if peer_vals_numeric.empty:
+            # Clean and convert peer multiples to a float array, dropping
+            # missing and non-numeric values with a single finite mask
+            peer_vals = pd.to_numeric(comps[col], errors='coerce').to_numpy(dtype=np.float64)
+            peer_vals = peer_vals[np.isfinite(peer_vals)]
+            if peer_vals.size == 0:
                 continue
             
             # Filter out extreme outliers (beyond 3 standard deviations)
-            mean_mult = peer_vals_numeric.mean()
-            std_mult = peer_vals_numeric.std()
+            mean_mult = peer_vals.mean()
+            std_mult = peer_vals.std(ddof=1) if peer_vals.size > 1 else 0.0
             if std_mult > 0:
-                peer_vals_filtered = peer_vals_numeric[
-                    (peer_vals_numeric >= mean_mult - 3 * std_mult) & 
-                    (peer_vals_numeric <= mean_mult + 3 * std_mult)
+                peer_vals_filtered = peer_vals[
+                    (peer_vals >= mean_mult - 3 * std_mult) & 
+                    (peer_vals <= mean_mult + 3 * std_mult)
                 ]
             else:
-                peer_vals_filtered = peer_vals_numeric
+                peer_vals_filtered = peer_vals
             
-            if peer_vals_filtered.empty:
+            if peer_vals_filtered.size == 0:
                 continue
             
             # Calculate implied enterprise values
@@ -123,11 +133,11 @@ def analyze_comparable_multiples(params: ValuationParameters, comps: pd.DataFram
             result = {
                 "Multiple": col,
                 "Mean Implied EV": implied_evs.mean(),
-                "Median Implied EV": implied_evs.median(),
-                "Std Dev Implied EV": implied_evs.std(),
+                "Median Implied EV": np.median(implied_evs),
+                "Std Dev Implied EV": implied_evs.std(ddof=1) if implied_evs.size > 1 else float('nan'),
                 "Min Implied EV": implied_evs.min(),
                 "Max Implied EV": implied_evs.max(),
-                "Peer Count": len(peer_vals_filtered),
+                "Peer Count": int(peer_vals_filtered.size),
                 "Our Metric": our_metric,
                 "Mean Multiple": peer_vals_filtered.mean()
             }
@@ -7,6 +7,7 @@ Provides professional-grade parameter validation and cost of capital calculation
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
+import numpy as np
 
 @dataclass
 class ValuationParameters:
@@ -133,19 +134,47 @@ class ValuationParameters:
             ("net_working_capital_changes", self.net_working_capital_changes)
         ]
         
-        # Filter out empty lists
-        non_empty_lists = [(name, lst) for name, lst in financial_lists if lst]
+        # Measure each list once, skipping empty ones
+        list_lengths = [(name, len(lst)) for name, lst in financial_lists]
+        non_empty_lengths = [(name, length) for name, length in list_lengths if length]
         
-        if len(non_empty_lists) > 1:
-            list_lengths = [len(lst) for name, lst in non_empty_lists]
-            if len(set(list_lengths)) > 1:
-                length_info = ", ".join([f"{name}={len(lst)}" for name, lst in non_empty_lists])
-                raise ValueError(f"All financial input lists must have the same length: {length_info}")
+        if len({length for _, length in non_empty_lengths}) > 1:
+            length_info = ", ".join([f"{name}={length}" for name, length in non_empty_lengths])
+            raise ValueError(f"All financial input lists must have the same length: {length_info}")
         
-        # Validate revenue values
-        if self.revenue_projections and any(revenue <= 0 for revenue in self.revenue_projections):
+        # Validate revenue values in one vectorized comparison (NaN fails it too)
+        if len(self.revenue_projections) and not (np.asarray(self.revenue_projections) > 0).all():
             raise ValueError("All revenue projections must be positive")
     
+    def _unchecked_clone(self, **overrides) -> "ValuationParameters":
+        """
+        Copy these parameters with field overrides, skipping __post_init__ validation.
+        
+        Intended for trusted callers (sensitivity and Monte Carlo sweeps) that start from
+        already-validated parameters and only reassign scalar fields. The copy is shallow:
+        projection lists and dicts are shared with the original and must not be mutated.
+        
+        Args:
+            **overrides: Field values to set on the copy
+        
+        Returns:
+            ValuationParameters: Unvalidated copy with the overrides applied
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__ = {**self.__dict__, **overrides}
+        return clone
+    
+    def _debt_to_equity_ratio(self) -> float:
+        """
+        Current debt-to-equity ratio used to relever or unlever beta (Hamada).
+        
+        Returns:
+            float: Year-0 debt over current equity value (1000.0 if unset), 0.0 if equity is not positive
+        """
+        current_debt = self.debt_schedule.get(0, 0.0)
+        current_equity = self.current_equity_value if self.current_equity_value else 1000.0
+        return current_debt / current_equity if current_equity > 0 else 0.0
+    
     def calculate_unlevered_cost_of_equity(self) -> float:
         """
         Calculate unlevered cost of equity using available inputs.
@@ -163,10 +192,7 @@ class ValuationParameters:
         
         # Calculate from levered beta if available
         if self.levered_beta > 0 and self.levered_cost_of_equity > 0:
-            current_debt = self.debt_schedule.get(0, 0.0)
-            current_equity = self.current_equity_value if self.current_equity_value else 1000.0
-            debt_ratio = current_debt / current_equity if current_equity > 0 else 0.0
-            
+            debt_ratio = self._debt_to_equity_ratio()
             unlevered_beta = self.levered_beta / (1 + (1 - self.corporate_tax_rate) * debt_ratio)
             return self.risk_free_rate + unlevered_beta * self.equity_risk_premium
         
@@ -193,10 +219,6 @@ class ValuationParameters:
             return self.risk_free_rate + self.levered_beta * self.equity_risk_premium
         
         # Calculate from unlevered beta if available
-        unlevered_cost = self.calculate_unlevered_cost_of_equity()
-        current_debt = self.debt_schedule.get(0, 0.0)
-        current_equity = self.current_equity_value if self.current_equity_value else 1000.0
-        debt_ratio = current_debt / current_equity if current_equity > 0 else 0.0
-        
+        debt_ratio = self._debt_to_equity_ratio()
         levered_beta = self.unlevered_beta * (1 + (1 - self.corporate_tax_rate) * debt_ratio)
         return self.risk_free_rate + levered_beta * self.equity_risk_premium 
\ No newline at end of file
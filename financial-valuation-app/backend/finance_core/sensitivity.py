@@ -4,16 +4,25 @@ Clean Sensitivity Analysis Module
 Barebones sensitivity analysis without extra dependencies.
 """
 
+import numpy as np
 import pandas as pd
-from copy import deepcopy
 from typing import Dict, List, Any
 
 from .params import ValuationParameters
-from .dcf import calculate_dcf_valuation_wacc
+from .dcf import calculate_dcf_valuation_wacc, resolve_free_cash_flow_series
+from .error_messages import FinanceCoreError
 
-def create_parameter_copy(params: ValuationParameters) -> ValuationParameters:
-    """Create a copy of parameters for sensitivity analysis."""
-    return deepcopy(params)
+# Fields the free cash flow series is derived from; sweeping any other
+# parameter leaves the FCF unchanged, so it can be projected once
+_FCF_DRIVER_FIELDS = frozenset((
+    "revenue_projections",
+    "ebit_margin",
+    "capital_expenditure",
+    "depreciation_expense",
+    "net_working_capital_changes",
+    "corporate_tax_rate",
+    "free_cash_flow_series"
+))
 
 def perform_sensitivity_analysis(params: ValuationParameters) -> pd.DataFrame:
     """
@@ -25,37 +34,46 @@ def perform_sensitivity_analysis(params: ValuationParameters) -> pd.DataFrame:
     if not params.sensitivity_parameter_ranges:
         raise ValueError("No sensitivity ranges provided")
     
-    # Pre-allocate data structure for efficiency
+    # Pre-allocate one NaN-filled float64 block, with an EV and a price-per-share
+    # column per parameter; points that fail are simply left as NaN
     max_length = max(len(test_values) for test_values in params.sensitivity_parameter_ranges.values())
-    data = {}
-    for param_name in params.sensitivity_parameter_ranges.keys():
-        data[f"{param_name}_ev"] = [float('nan')] * max_length
-        data[f"{param_name}_price_per_share"] = [float('nan')] * max_length
+    columns = [
+        f"{param_name}{suffix}"
+        for param_name in params.sensitivity_parameter_ranges
+        for suffix in ("_ev", "_price_per_share")
+    ]
+    results = np.full((max_length, len(columns)), np.nan, dtype=np.float64)
+    
+    # Project the base FCF once for the sweeps that do not move it; if the inputs
+    # cannot be projected, every point falls back to projecting (and failing) itself
+    try:
+        base_free_cash_flow_series = resolve_free_cash_flow_series(params)
+    except (FinanceCoreError, ValueError):
+        base_free_cash_flow_series = None
     
     # Run sensitivity analysis for each parameter
-    for param_name, test_values in params.sensitivity_parameter_ranges.items():
-        # Map range parameter names to actual parameter names
-        param_mapping = {
-            "weighted_average_cost_of_capital": "weighted_average_cost_of_capital",
-            "ebit_margin": "ebit_margin", 
-            "terminal_growth_rate": "terminal_growth_rate",
-            "target_debt_to_value_ratio": "target_debt_to_value_ratio"
-        }
-        actual_param_name = param_mapping.get(param_name, param_name)
+    for param_index, (param_name, test_values) in enumerate(params.sensitivity_parameter_ranges.items()):
+        ev_column = 2 * param_index
+        
+        overrides = {}
+        if base_free_cash_flow_series is not None and param_name not in _FCF_DRIVER_FIELDS:
+            overrides["free_cash_flow_series"] = base_free_cash_flow_series
         
         for i, test_value in enumerate(test_values):
             try:
-                # Create parameter copy with test value
-                p = create_parameter_copy(params)
-                setattr(p, actual_param_name, test_value)
+                # Create parameter copy with test value (and the shared FCF, when unaffected).
+                # The copy is shallow and unvalidated: the sweep only reassigns scalar fields
+                # on it and the DCF never mutates its inputs, so shared lists stay intact.
+                overrides[param_name] = test_value
+                p = params._unchecked_clone(**overrides)
                 
                 # For target debt ratio changes, recalculate WACC
-                if actual_param_name == "target_debt_to_value_ratio":
+                if param_name == "target_debt_to_value_ratio":
                     cost_of_equity = p.calculate_levered_cost_of_equity()
                     p.weighted_average_cost_of_capital = (1 - test_value) * cost_of_equity + test_value * p.cost_of_debt * (1 - p.corporate_tax_rate)
                 
                 # For WACC changes, ensure it's used directly (not overridden by target structure)
-                if actual_param_name == "weighted_average_cost_of_capital":
+                if param_name == "weighted_average_cost_of_capital":
                     # Temporarily set target_debt_to_value_ratio to None to avoid override
                     # This will be handled by the WACC calculation logic
                     p.target_debt_to_value_ratio = None
@@ -64,12 +82,12 @@ def perform_sensitivity_analysis(params: ValuationParameters) -> pd.DataFrame:
                 ev, equity, price_per_share, _, _, _ = calculate_dcf_valuation_wacc(p)
                 
                 # Store both EV and price per share
-                data[f"{param_name}_ev"][i] = ev
-                data[f"{param_name}_price_per_share"][i] = price_per_share if price_per_share else float('nan')
+                results[i, ev_column] = ev
+                results[i, ev_column + 1] = price_per_share if price_per_share else np.nan
                 
-            except Exception as e:
-                data[f"{param_name}_ev"][i] = float('nan')
-                data[f"{param_name}_price_per_share"][i] = float('nan')
+            except Exception:
+                # Leave this point's row as NaN
+                continue
     
-    # Convert to DataFrame
-    return pd.DataFrame(data) 
\ No newline at end of file
+    # Wrap the block as a single float64 DataFrame without copying it
+    return pd.DataFrame(results, columns=columns, copy=False) 
\ No newline at end of file
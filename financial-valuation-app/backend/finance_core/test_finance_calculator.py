@@ -62,7 +62,7 @@ class TestFinancialInputs(unittest.TestCase):
         """Test creating FinancialInputs with basic data."""
         inputs = self._create_basic_inputs()
         
-        self.assertEqual(inputs.revenue, [100, 110, 121])
+        self.assertEqual(inputs.revenue.tolist(), [100, 110, 121])
         self.assertEqual(inputs.ebit_margin, 0.15)
         self.assertEqual(inputs.wacc, 0.10)
         self.assertEqual(inputs.share_count, 10.0)
@@ -84,6 +84,23 @@ class TestFinancialInputs(unittest.TestCase):
         self.assertIsNotNone(inputs.scenarios)
         self.assertIsNotNone(inputs.sensitivity_analysis)
         self.assertIsNotNone(inputs.monte_carlo_specs)
+    
+    def test_financial_inputs_null_series_is_empty(self):
+        """Test that a null series is treated as an empty (missing) series."""
+        inputs = self._create_basic_inputs(revenue=None, capex=None)
+        
+        self.assertEqual(inputs.revenue.shape, (0,))
+        self.assertEqual(inputs.capex.shape, (0,))
+    
+    def test_financial_inputs_null_element_rejected(self):
+        """Test that a null entry in a series raises FinanceCoreError."""
+        with self.assertRaises(FinanceCoreError):
+            self._create_basic_inputs(revenue=[100, None, 121])
+    
+    def test_financial_inputs_string_element_rejected(self):
+        """Test that a non-numeric string entry in a series raises FinanceCoreError."""
+        with self.assertRaises(FinanceCoreError):
+            self._create_basic_inputs(capex=['x', 22, 24])
 
 class TestFinancialValuationEngine(unittest.TestCase):
     """Test the main FinancialValuationEngine class."""
@@ -127,7 +144,7 @@ class TestFinancialValuationEngine(unittest.TestCase):
         """Test conversion of FinancialInputs to ValuationParameters."""
         params = self.engine._convert_to_valuation_params(self.basic_inputs)
         self.assertIsInstance(params, ValuationParameters)
-        self.assertEqual(params.revenue_projections, [100, 110, 121])
+        self.assertEqual(params.revenue_projections.tolist(), [100, 110, 121])
         self.assertEqual(params.ebit_margin, 0.15)
         self.assertEqual(params.weighted_average_cost_of_capital, 0.10)
     
@@ -138,6 +155,14 @@ class TestFinancialValuationEngine(unittest.TestCase):
         params = self.engine._convert_to_valuation_params(inputs)
         self.assertEqual(params.debt_schedule, {0: 50.0, 1: 40.0})
     
+    def test_comprehensive_valuation_converts_inputs_once(self):
+        """Test that a comprehensive valuation shares one parameter conversion across analyses."""
+        with patch.object(self.engine, '_convert_to_valuation_params',
+                          wraps=self.engine._convert_to_valuation_params) as convert:
+            self.engine.perform_comprehensive_valuation(self.basic_inputs)
+        
+        self.assertEqual(convert.call_count, 1)
+    
     def test_validate_required_inputs_success(self):
         """Test successful validation of required inputs."""
         # Should not raise an exception
@@ -150,6 +175,32 @@ class TestFinancialValuationEngine(unittest.TestCase):
         with self.assertRaises(FinanceCoreError):
             self.engine._validate_required_inputs(invalid_inputs)
     
+    def test_validate_required_inputs_null_revenue(self):
+        """Test validation with a null revenue field."""
+        invalid_inputs = self._create_basic_inputs(revenue=None)
+        
+        with self.assertRaises(FinanceCoreError) as context:
+            self.engine._validate_required_inputs(invalid_inputs)
+        self.assertIn("Required field 'revenue' is missing", str(context.exception))
+    
+    def test_parse_financial_inputs_rejects_invalid_series_entries(self):
+        """Test that null and string series entries fail with FinanceCoreError."""
+        for bad_revenue in ([1000, 1100, None], ['x', 1100, 1200]):
+            data = {
+                "revenue": bad_revenue,
+                "ebit_margin": 0.15,
+                "capex": [100, 110, 120],
+                "depreciation": [50, 55, 60],
+                "nwc_changes": [10, 11, 12],
+                "tax_rate": 0.25,
+                "terminal_growth": 0.02,
+                "wacc": 0.10,
+                "share_count": 100.0,
+                "cost_of_debt": 0.05
+            }
+            with self.assertRaises(FinanceCoreError):
+                parse_financial_inputs(data)
+    
     def test_validate_required_inputs_negative_values(self):
         """Test validation with negative values."""
         invalid_inputs = self._create_basic_inputs(ebit_margin=-0.15)  # Negative value
@@ -563,6 +614,34 @@ class TestSensitivityAnalysis(unittest.TestCase):
         self.assertIn("wacc_range", ranges)
         self.assertIn("ebit_margin_range", ranges)
         self.assertIn("terminal_growth_range", ranges)
+    
+    def test_sensitivity_leaves_base_parameters_unchanged(self):
+        """Test that the sweep's shallow clones do not modify the base parameters."""
+        inputs = FinancialInputs(
+            revenue=[100, 110, 121],
+            ebit_margin=0.15,
+            capex=[20, 22, 24],
+            depreciation=[15, 16, 17],
+            nwc_changes=[5, 5.5, 6],
+            tax_rate=0.25,
+            terminal_growth=0.03,
+            wacc=0.10,
+            share_count=10.0,
+            cost_of_debt=0.06,
+            sensitivity_analysis={
+                "weighted_average_cost_of_capital": [0.08, 0.12],
+                "ebit_margin": [0.12, 0.20]
+            },
+        )
+        params = self.engine._convert_to_valuation_params(inputs)
+        
+        results_df = perform_sensitivity_analysis(params)
+        
+        self.assertFalse(results_df.isna().any().any())
+        self.assertEqual(params.weighted_average_cost_of_capital, 0.10)
+        self.assertEqual(params.ebit_margin, 0.15)
+        self.assertEqual(params.target_debt_to_value_ratio, 0.3)
+        self.assertEqual(params.revenue_projections.tolist(), [100, 110, 121])
 
 class TestMonteCarloSimulation(unittest.TestCase):
     """Test Monte Carlo simulation."""
@@ -757,7 +836,7 @@ class TestJSONIntegration(unittest.TestCase):
         inputs = parse_financial_inputs(json_data)
         
         # Check that inputs were created correctly
-        self.assertEqual(inputs.revenue, [100, 110, 121])
+        self.assertEqual(inputs.revenue.tolist(), [100, 110, 121])
         self.assertEqual(inputs.ebit_margin, 0.15)
         self.assertEqual(inputs.tax_rate, 0.25)
         self.assertEqual(inputs.wacc, 0.10)
@@ -789,7 +868,7 @@ class TestJSONIntegration(unittest.TestCase):
         inputs = parse_financial_inputs(json_data)
         
         # Check that inputs were created correctly
-        self.assertEqual(inputs.revenue, [100, 110, 121])
+        self.assertEqual(inputs.revenue.tolist(), [100, 110, 121])
         self.assertEqual(inputs.ebit_margin, 0.15)
         self.assertEqual(inputs.wacc, 0.10)
     
@@ -823,7 +902,7 @@ class TestJSONIntegration(unittest.TestCase):
             inputs = parse_financial_inputs(loaded_data)
             
             # Verify the data was loaded correctly
-            self.assertEqual(inputs.revenue, [100, 110, 121])
+            self.assertEqual(inputs.revenue.tolist(), [100, 110, 121])
             self.assertEqual(inputs.ebit_margin, 0.15)
             self.assertEqual(inputs.tax_rate, 0.25)
             
@@ -429,8 +429,7 @@ class TestGenerateCSVReport(unittest.TestCase):
         for row in report:
             if len(row) >= 2 and row[0] == 'Revenue ($M)':
                 revenue_found = True
-                # The loop overwrites the first column with the last year's value
-                self.assertIn('1400.0', row[1])  # Year 5 (last year overwrites)
+                self.assertEqual(row[1:], ['1000.0', '1100.0', '1200.0', '1300.0', '1400.0'])
                 break
         
         self.assertTrue(revenue_found)
@@ -250,7 +250,7 @@ def calculate_iterative_wacc(valuation_parameters: "ValuationParameters", max_it
     # Priority 3: Fallback to simple calculation using estimated market values
     estimated_equity_value = (
         valuation_parameters.revenue_projections[0] * 2.0 
-        if valuation_parameters.revenue_projections else 1000.0
+        if len(valuation_parameters.revenue_projections) else 1000.0
     )
     estimated_debt_value = valuation_parameters.debt_schedule.get(0, 0.0)
     cost_of_equity = valuation_parameters.calculate_levered_cost_of_equity()